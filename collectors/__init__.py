@@ -2,72 +2,506 @@
 Data collectors for crypto derivatives market intelligence dashboard.
 """
 
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
+import itertools
+import os
+import random
 import time
-import requests
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlencode, urlparse
+
+import aiohttp
+import ijson
+from aiohttp import compression_utils
+import numpy as np
+import orjson
 
 DEFAULT_TIMEOUT = 30
+CONNECT_TIMEOUT = 10  # seconds to open a new connection, within DEFAULT_TIMEOUT
 MAX_RETRIES = 4
 RETRY_DELAY = 2  # seconds, doubles each retry
-REQUEST_INTERVAL = 0.5  # seconds between requests to avoid 429s
+MAX_RETRY_DELAY = 30  # seconds; a longer Retry-After gives up rather than waits
+REQUEST_INTERVAL = 0.5  # default seconds between requests to avoid 429s
+MAX_CONNECTIONS = 64  # open sockets across all hosts
+MAX_CONNECTIONS_PER_HOST = 8
+KEEPALIVE_TIMEOUT = 300  # seconds an idle pooled connection is kept open
+DNS_CACHE_TTL = 300  # seconds a resolved host address is reused
+USER_AGENT = "options-market-intelligence/1.0"
+STREAM_PARSE_MIN_BYTES = 256 * 1024  # stream-parse bodies larger than this when keys are given
+
+# Per-host (requests/second, burst) limits. Hosts not listed here are held
+# to one request every REQUEST_INTERVAL seconds.
+HOST_RATE_LIMITS = {
+    "api.llama.fi": (10, 20),
+    "gamma-api.polymarket.com": (5, 5),
+    "api.elections.kalshi.com": (10, 10),
+}
+
+# Per-host cap on requests in flight (including ones waiting for a token)
+HOST_CONCURRENCY = {
+    "api.llama.fi": 8,
+}
+DEFAULT_HOST_CONCURRENCY = 4
+
+# Token buckets and semaphores keyed by host, created on first use
+_buckets = {}
+_semaphores = {}
+
+# On-disk cache for GET responses that change slowly
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache", "http")
+
+# Cache lifetime in seconds by URL prefix (first match wins). URLs that
+# match no prefix are never cached.
+CACHE_TTLS = [
+    ("https://api.llama.fi/protocol/", 6 * 60 * 60),  # full TVL history
+    ("https://api.llama.fi/", 10 * 60),  # summaries and overviews
+    ("https://gamma-api.polymarket.com/tags", 6 * 60 * 60),  # category labels
+]
+
+# How long a cached 404 keeps us from asking for the same URL again
+NOT_FOUND_TTL = 24 * 60 * 60
+
+# YYYY-MM-DD strings by days since the epoch, shared by every history series
+_date_strings = {}
+
+# Shared HTTP session, created lazily on first request, and the event loop
+# it (and the rate limiters) belong to
+_session = None
+_session_loop = None
+
+# Long-lived event loop used by run(), so the session outlives one refresh
+_loop = None
+
+
+def _accept_encoding():
+    """
+    Accept-Encoding value listing the codecs aiohttp can decode here, best first.
+
+    Brotli (and zstd where available) compress DefiLlama's large JSON bodies
+    noticeably better than gzip; only advertise what we can actually decode.
+    """
+    encodings = []
+    if getattr(compression_utils, "HAS_ZSTD", False):
+        encodings.append("zstd")
+    if getattr(compression_utils, "HAS_BROTLI", False):
+        encodings.append("br")
+    encodings += ["gzip", "deflate"]
+    return ", ".join(encodings)
+
+
+def _json_dumps(obj):
+    """Serialize a request body with orjson (aiohttp expects a str)."""
+    return orjson.dumps(obj).decode()
+
+
+def get_session():
+    """
+    Return the shared aiohttp session, creating it on first use.
+
+    All collectors go through this one session so keep-alive connections
+    (and their TLS handshakes) are reused across every request to a host.
+    Must be called from inside the running event loop.
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if loop is not _session_loop:
+        # Sessions, locks and semaphores are bound to the loop that made them
+        _buckets.clear()
+        _semaphores.clear()
+        _session = None
+        _session_loop = loop
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=MAX_CONNECTIONS,
+            limit_per_host=MAX_CONNECTIONS_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            enable_cleanup_closed=True,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"User-Agent": USER_AGENT, "Accept-Encoding": _accept_encoding()},
+            json_serialize=_json_dumps,
+        )
+    return _session
+
+
+async def close_session():
+    """Close the shared HTTP session once all collectors have finished."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
+def run(coro):
+    """
+    Run a coroutine on the collectors' long-lived event loop.
+
+    Unlike asyncio.run, the loop is kept between calls, so a process that
+    refreshes the dashboard repeatedly keeps the shared session and its
+    warm connections instead of reconnecting every time.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop.run_until_complete(coro)
+
+
+@atexit.register
+def _shutdown():
+    """Close the shared session and the long-lived loop at interpreter exit."""
+    global _loop
+    if _loop is not None and not _loop.is_closed():
+        _loop.run_until_complete(close_session())
+        _loop.close()
+    _loop = None
+
+
+class TokenBucket:
+    """Rate limiter allowing `rate` requests/second with bursts up to `capacity`."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wait until a token is available, then consume it."""
+        # Waiters queue on the lock, so tokens are handed out in arrival order
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+async def _throttle(url):
+    """Wait if needed to stay under the rate limit for the URL's host."""
+    host = urlparse(url).netloc
+    bucket = _buckets.get(host)
+    if bucket is None:
+        rate, burst = HOST_RATE_LIMITS.get(host, (1 / REQUEST_INTERVAL, 1))
+        bucket = _buckets[host] = TokenBucket(rate, burst)
+    await bucket.acquire()
+
+
+@contextlib.asynccontextmanager
+async def _request_slot(url):
+    """Hold one of the host's concurrency slots, then wait for a rate-limit token."""
+    host = urlparse(url).netloc
+    semaphore = _semaphores.get(host)
+    if semaphore is None:
+        limit = HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+        semaphore = _semaphores[host] = asyncio.Semaphore(limit)
+    async with semaphore:
+        await _throttle(url)
+        yield
+
+
+def _parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date)."""
+    if not value:
+        return 0
+    try:
+        return max(0, int(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0, retry_at.timestamp() - time.time())
+
+
+def _backoff_delay(attempt, retry_after=0):
+    """
+    Jittered exponential backoff for the given attempt.
+
+    The delay is drawn from [base/2, 3*base/2] so concurrent requests that
+    failed together don't all retry at the same instant, but never comes in
+    earlier than the server's Retry-After. The exponential part is capped at
+    MAX_RETRY_DELAY.
+    """
+    base = max(retry_after, min(RETRY_DELAY * (2 ** attempt), MAX_RETRY_DELAY))
+    low = max(retry_after, base * 0.5)
+    return round(random.uniform(low, max(low, min(base * 1.5, MAX_RETRY_DELAY))), 2)
+
+
+def _cache_ttl(url):
+    """Return how long responses for this URL may be served from cache."""
+    for prefix, ttl in CACHE_TTLS:
+        if url.startswith(prefix):
+            return ttl
+    return 0
+
+
+def _cache_path(url, params, keys=None):
+    """Cache file path for a URL, its query parameters and any key selection."""
+    query = urlencode(sorted(params.items())) if params else ""
+    selection = ",".join(sorted(keys)) if keys else ""
+    key = hashlib.sha1(f"{url}?{query}#{selection}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{key}.json")
 
-# Track last request time for throttling
-_last_request_time = 0
 
+def _cache_read(path):
+    """Load a cache entry ({etag, lastModified, body}), or None if missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            entry = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or "body" not in entry:
+        return None
+    return entry
 
-def _throttle():
-    """Wait if needed to stay under rate limits."""
-    global _last_request_time
-    now = time.monotonic()
-    elapsed = now - _last_request_time
-    if elapsed < REQUEST_INTERVAL:
-        time.sleep(REQUEST_INTERVAL - elapsed)
-    _last_request_time = time.monotonic()
 
+def _cache_age(path):
+    """Seconds since a cache entry was last written or revalidated."""
+    try:
+        return time.time() - os.path.getmtime(path)
+    except OSError:
+        return float("inf")
 
-def api_get(url, params=None, timeout=DEFAULT_TIMEOUT):
-    """Make a GET request with retries, rate limiting, and exponential backoff."""
+
+def _cache_write(path, entry):
+    """Store a cache entry, replacing any previous copy atomically."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"  Could not write cache file {path}: {e}")
+
+
+async def _read_keys(stream, keys):
+    """
+    Incrementally parse a JSON object, materializing only the given top-level keys.
+
+    Everything else is skipped as it streams past, so peak memory is bounded
+    by the selected values rather than the whole document.
+    """
+    result = {}
+    key = builder = None
+    depth = 0
+    async for _, event, value in ijson.parse_async(stream, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+        elif depth == 1 and event == "map_key":
+            key = value
+        elif depth == 1 and key in keys and event != "end_map":
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                result[key] = value
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if builder is not None and depth == 1:
+                result[key] = builder.value
+                builder = None
+    return result
+
+
+async def _read_json(resp, keys=None):
+    """Decode a response body, keeping only `keys` of the top-level object if given."""
+    if not keys or (resp.content_length is not None
+                    and resp.content_length < STREAM_PARSE_MIN_BYTES):
+        body = await resp.read()
+        data = orjson.loads(body) if body.strip() else None
+        if not keys:
+            return data
+        if not isinstance(data, dict):
+            return {}
+        return {k: v for k, v in data.items() if k in keys}
+    return await _read_keys(resp.content, keys)
+
+
+async def api_get(url, params=None, timeout=DEFAULT_TIMEOUT, keys=None):
+    """
+    Make a GET request with retries, rate limiting, and exponential backoff.
+
+    If `keys` is given, only those top-level keys of the JSON object are
+    kept, and large bodies are stream-parsed instead of loaded whole.
+
+    Responses for URLs listed in CACHE_TTLS are served from disk while fresh.
+    Once expired they are revalidated with If-None-Match / If-Modified-Since,
+    and a stale copy is returned if every attempt to refresh them fails.
+    A 404 for a cacheable URL is remembered for NOT_FOUND_TTL so later runs
+    don't request it again.
+    """
+    ttl = _cache_ttl(url)
+    if not ttl:
+        result = await _request("GET", url, params=params, keys=keys, timeout=timeout)
+        return result[2] if result else None
+
+    path = _cache_path(url, params, keys)
+    entry = _cache_read(path)
+    if entry is not None and entry.get("status") == 404:
+        if _cache_age(path) < NOT_FOUND_TTL:
+            print(f"  Skipping known 404: {url}")
+            return None
+        entry = None
+    if entry is not None and _cache_age(path) < ttl:
+        return entry["body"]
+
+    validators = {}
+    if entry is not None:
+        if entry.get("etag"):
+            validators["If-None-Match"] = entry["etag"]
+        if entry.get("lastModified"):
+            validators["If-Modified-Since"] = entry["lastModified"]
+
+    result = await _request("GET", url, params=params, headers=validators,
+                          keys=keys, timeout=timeout)
+    if result is None:
+        if entry is not None:
+            print(f"  Using stale cached response for {url}")
+            return entry["body"]
+        return None
+
+    status, headers, data = result
+    if status == 304:
+        # Unchanged upstream: keep the cached body and restart its TTL
+        if entry is None:
+            return None
+        os.utime(path)
+        return entry["body"]
+    if status == 404:
+        _cache_write(path, {"status": 404, "body": None})
+        return None
+    if data is not None:
+        _cache_write(path, {
+            "etag": headers.get("ETag"),
+            "lastModified": headers.get("Last-Modified"),
+            "body": data,
+        })
+    return data
+
+
+async def _request(method, url, params=None, json_body=None, headers=None,
+                   keys=None, timeout=DEFAULT_TIMEOUT):
+    """
+    Send a request and decode its JSON body, retrying transient failures.
+
+    This is the single place that applies throttling, 429 handling and
+    backoff, so api_get and api_post always share the same retry policy.
+    Returns (status, response headers, decoded body) — the body is None for
+    304 Not Modified and 404 Not Found — or None if the request failed.
+    """
+    session = get_session()
     for attempt in range(MAX_RETRIES):
-        _throttle()
         try:
-            resp = requests.get(url, params=params, timeout=timeout)
-            if resp.status_code == 400:
-                print(f"  HTTP 400 Bad Request: {url}")
-                if resp.text:
-                    print(f"  Response: {resp.text[:200]}")
-                return None
-            if resp.status_code == 429:
-                # Rate limited — use Retry-After header if available
-                retry_after = int(resp.headers.get("Retry-After", 0))
-                wait = max(retry_after, RETRY_DELAY * (2 ** attempt))
+            async with _request_slot(url), session.request(
+                    method, url, params=params, json=json_body, headers=headers,
+                    timeout=aiohttp.ClientTimeout(
+                        total=timeout, sock_connect=CONNECT_TIMEOUT)) as resp:
+                if resp.status == 400:
+                    print(f"  HTTP 400 Bad Request: {url}")
+                    text = await resp.text()
+                    if text:
+                        print(f"  Response: {text[:200]}")
+                    return None
+                if resp.status == 304:
+                    return resp.status, resp.headers, None
+                if resp.status == 404:
+                    # Terminal, but reported so api_get can remember it
+                    print(f"  HTTP 404 Not Found: {url}")
+                    return resp.status, resp.headers, None
+                if resp.status != 429:
+                    resp.raise_for_status()
+                    return resp.status, resp.headers, await _read_json(resp, keys)
+                # Rate limited — use Retry-After header if available, but
+                # don't sleep on a long wait or on the last attempt
+                retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+                if retry_after > MAX_RETRY_DELAY or attempt == MAX_RETRIES - 1:
+                    print(f"  HTTP 429 Rate Limited: {url} (giving up)")
+                    return None
+                wait = _backoff_delay(attempt, retry_after)
                 print(f"  HTTP 429 Rate Limited: {url} (waiting {wait}s)")
-                time.sleep(wait)
-                continue
-            resp.raise_for_status()
-            return resp.json()
-        except requests.HTTPError as e:
-            print(f"  HTTP {resp.status_code}: {url} - {e}")
-            if resp.status_code in (400, 404, 405):
+            # Back off after giving up the connection and the host slot
+            await asyncio.sleep(wait)
+        except aiohttp.ClientResponseError as e:
+            print(f"  HTTP {e.status}: {url} - {e.message}")
+            if e.status in (400, 405):
                 return None  # Don't retry client errors
             if attempt == MAX_RETRIES - 1:
                 print(f"  FAILED after {MAX_RETRIES} attempts: {url}")
                 return None
-            wait = RETRY_DELAY * (2 ** attempt)
+            retry_after = _parse_retry_after(e.headers.get("Retry-After") if e.headers else None)
+            if retry_after > MAX_RETRY_DELAY:
+                print(f"  Not retrying {url}: server asked to wait {retry_after:.0f}s")
+                return None
+            wait = _backoff_delay(attempt, retry_after)
             print(f"  Retry {attempt + 1}/{MAX_RETRIES} for {url} (waiting {wait}s)")
-            time.sleep(wait)
-        except (requests.RequestException, ValueError) as e:
+            await asyncio.sleep(wait)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, ijson.JSONError) as e:
             if attempt == MAX_RETRIES - 1:
                 print(f"  FAILED after {MAX_RETRIES} attempts: {url} - {e}")
                 return None
-            wait = RETRY_DELAY * (2 ** attempt)
+            wait = _backoff_delay(attempt)
             print(f"  Retry {attempt + 1}/{MAX_RETRIES} for {url} (waiting {wait}s)")
-            time.sleep(wait)
+            await asyncio.sleep(wait)
     return None
 
 
-def api_get_with_fallback(*urls, params=None, timeout=DEFAULT_TIMEOUT):
+def ttl_cache(ttl):
+    """
+    Memoize an async function per argument tuple for `ttl` seconds.
+
+    The pending task is cached rather than its result, so concurrent callers
+    asking for the same arguments share a single in-flight request. Failed
+    calls (an exception, or a None or empty result) are not kept, so the next
+    caller tries again instead of reusing the failure for the rest of the TTL.
+    """
+    def decorator(func):
+        cache = {}
+
+        def discard(args, hit):
+            if cache.get(args) is hit:
+                del cache[args]
+
+        @functools.wraps(func)
+        async def wrapper(*args):
+            now = time.monotonic()
+            hit = cache.get(args)
+            if (hit is None or hit[0] <= now
+                    or hit[1].get_loop() is not asyncio.get_running_loop()):
+                hit = cache[args] = (now + ttl, asyncio.ensure_future(func(*args)))
+            try:
+                # Shielded so one caller timing out doesn't cancel the others
+                result = await asyncio.shield(hit[1])
+            except Exception:
+                discard(args, hit)
+                raise
+            if not result:
+                discard(args, hit)
+            return result
+        return wrapper
+    return decorator
+
+
+async def api_get_with_fallback(*urls, params=None, timeout=DEFAULT_TIMEOUT, keys=None):
     """Try multiple URLs in order, returning the first successful response."""
     for url in urls:
-        result = api_get(url, params=params, timeout=timeout)
+        result = await api_get(url, params=params, timeout=timeout, keys=keys)
         if result is not None:
             return result
         print(f"  Trying next fallback URL...")
@@ -75,24 +509,57 @@ def api_get_with_fallback(*urls, params=None, timeout=DEFAULT_TIMEOUT):
     return None
 
 
-def api_post(url, json_body, timeout=DEFAULT_TIMEOUT):
-    """Make a POST request with retries and exponential backoff."""
-    for attempt in range(MAX_RETRIES):
-        _throttle()
-        try:
-            resp = requests.post(url, json=json_body, timeout=timeout)
-            resp.raise_for_status()
-            return resp.json()
-        except (requests.RequestException, ValueError) as e:
-            if attempt == MAX_RETRIES - 1:
-                print(f"  FAILED after {MAX_RETRIES} attempts: {url} - {e}")
-                return None
-            wait = RETRY_DELAY * (2 ** attempt)
-            print(f"  Retry {attempt + 1}/{MAX_RETRIES} for {url} (waiting {wait}s)")
-            time.sleep(wait)
-    return None
+async def api_post(url, json_body, timeout=DEFAULT_TIMEOUT):
+    """Make a POST request with retries, rate limiting, and exponential backoff."""
+    result = await _request("POST", url, json_body=json_body, timeout=timeout)
+    return result[2] if result else None
+
+
+def select_fields(rows, fields):
+    """
+    Copy each dict in `rows` keeping only `fields`; anything that isn't a dict is dropped.
+
+    Looks up the few wanted fields directly instead of scanning every key of
+    every row, which matters for API objects carrying dozens of fields.
+    """
+    return [{k: row[k] for k in fields if k in row} for row in rows if isinstance(row, dict)]
+
+
+def field_column(rows, field, dtype=np.float64):
+    """NumPy column of a numeric field across a list of dicts; missing/null count as zero."""
+    try:
+        # Fast path: dict.get mapped in C, with no per-row Python frame
+        column = np.fromiter(map(dict.get, rows, itertools.repeat(field)), dtype=dtype, count=len(rows))
+    except (TypeError, ValueError):
+        # Some rows lack the field or have it null/empty
+        return np.fromiter((row.get(field) or 0 for row in rows), dtype=dtype, count=len(rows))
+    if column.dtype.kind == "f":
+        # Float columns turn null/missing into NaN instead of failing; JSON
+        # numbers are never NaN, so those are exactly the rows to zero
+        column[np.isnan(column)] = 0
+    return column
+
+
+def sum_fields(rows, fields, dtype=np.float64):
+    """
+    Sum numeric fields across a list of dicts, one vectorized pass per field.
+
+    Missing and null values count as zero. Totals come back as plain Python
+    numbers ({ field: total }) so they stay JSON-serializable.
+    """
+    return {field: field_column(rows, field, dtype).sum().item() for field in fields}
+
 
+def ts_to_dates(timestamps):
+    """
+    Convert a sequence of unix timestamps (seconds) to YYYY-MM-DD strings in one pass.
 
-def ts_to_date(ts):
-    """Convert unix timestamp (seconds) to YYYY-MM-DD string."""
-    return time.strftime("%Y-%m-%d", time.gmtime(ts))
+    Each calendar day maps to one shared string object, so the many history
+    series keyed by the same dates don't each hold their own copies.
+    """
+    days = (np.asarray(timestamps, dtype=np.int64) // 86400).tolist()
+    missing = [day for day in set(days) if day not in _date_strings]
+    if missing:
+        labels = np.datetime_as_string(np.array(missing, dtype="datetime64[D]"), unit="D")
+        _date_strings.update(zip(missing, labels.tolist()))
+    return [_date_strings[day] for day in days]
@@ -10,12 +10,26 @@ Free endpoints used:
 - /protocol/{protocol} - TVL history
 """
 
-from collectors import api_get, api_get_with_fallback, ts_to_date
+import asyncio
+
+import numpy as np
+
+from collectors import (
+    api_get, api_get_with_fallback, field_column, ts_to_dates, ttl_cache,
+)
 
 # All free-tier endpoints use api.llama.fi
 # Pro API alternative: https://pro-api.llama.fi/{API_KEY}/...
 BASE_URL = "https://api.llama.fi"
 
+# Top-level response keys we actually read. Summary and protocol payloads
+# also carry large per-chain breakdowns that are skipped while parsing.
+SUMMARY_KEYS = (
+    "name", "totalDataChart", "total24h", "total7d", "total30d",
+    "totalAllTime", "change_1d", "change_7d", "change_1m",
+)
+TVL_KEYS = ("name", "tvl", "currentChainTvls")
+
 # Known perps protocols and their DefiLlama slugs
 PERPS_PROTOCOLS = {
     "hyperliquid": "Hyperliquid",
@@ -57,12 +71,9 @@ def _extract_chart_data(data, key="totalDataChart"):
     chart = data.get(key, [])
     if not chart:
         return {}
-    result = {}
-    for entry in chart:
-        if isinstance(entry, list) and len(entry) >= 2:
-            date = ts_to_date(entry[0])
-            result[date] = entry[1]
-    return result
+    entries = [entry for entry in chart if isinstance(entry, list) and len(entry) >= 2]
+    dates = ts_to_dates([entry[0] for entry in entries])
+    return {date: entry[1] for date, entry in zip(dates, entries)}
 
 
 def _extract_breakdown_chart(data, key="totalDataChartBreakdown"):
@@ -70,18 +81,18 @@ def _extract_breakdown_chart(data, key="totalDataChartBreakdown"):
     chart = data.get(key, [])
     if not chart:
         return {}
-    result = {}
-    for entry in chart:
-        if isinstance(entry, list) and len(entry) >= 2:
-            date = ts_to_date(entry[0])
-            result[date] = entry[1] if isinstance(entry[1], dict) else {}
-    return result
+    entries = [entry for entry in chart if isinstance(entry, list) and len(entry) >= 2]
+    dates = ts_to_dates([entry[0] for entry in entries])
+    return {
+        date: entry[1] if isinstance(entry[1], dict) else {}
+        for date, entry in zip(dates, entries)
+    }
 
 
-def fetch_options_overview():
+async def fetch_options_overview():
     """Fetch options volume overview with historical data and per-protocol breakdown."""
     print("Fetching DefiLlama options overview...")
-    data = api_get(f"{BASE_URL}/overview/options")
+    data = await api_get(f"{BASE_URL}/overview/options")
     if not data:
         return None
 
@@ -95,6 +106,8 @@ def fetch_options_overview():
         slug = proto.get("module", proto.get("defillamaId", "")).lower()
         result["protocols"][name] = {
             "slug": slug,
+            # Entries without a module have no per-protocol summary endpoint
+            "hasModule": bool(proto.get("module")),
             "total24h": proto.get("total24h", 0),
             "total7d": proto.get("total7d", 0),
             "total30d": proto.get("total30d", 0),
@@ -109,10 +122,10 @@ def fetch_options_overview():
     return result
 
 
-def fetch_options_protocol(slug):
+async def fetch_options_protocol(slug):
     """Fetch historical options data for a specific protocol."""
     print(f"  Fetching options data for {slug}...")
-    data = api_get(f"{BASE_URL}/summary/options/{slug}")
+    data = await api_get(f"{BASE_URL}/summary/options/{slug}", keys=SUMMARY_KEYS)
     if not data:
         return None
     return {
@@ -123,13 +136,14 @@ def fetch_options_protocol(slug):
     }
 
 
-def fetch_perps_protocol_volume(slug):
+async def fetch_perps_protocol_volume(slug):
     """Fetch historical volume data for a specific perps protocol via derivatives endpoint."""
     print(f"  Fetching volume for {slug}...")
     # Try derivatives first (correct for perps), then dexs as fallback
-    data = api_get_with_fallback(
+    data = await api_get_with_fallback(
         f"{BASE_URL}/summary/derivatives/{slug}",
         f"{BASE_URL}/summary/dexs/{slug}",
+        keys=SUMMARY_KEYS,
     )
     if not data:
         return None
@@ -146,34 +160,60 @@ def fetch_perps_protocol_volume(slug):
     }
 
 
-def fetch_protocol_fees(slug):
-    """Fetch historical fees and revenue for a protocol."""
+def _json_sums(sums):
+    """
+    Float sums as a list of JSON numbers. Whole values come back as ints,
+    as they did when DefiLlama's integer fields were summed in Python.
+    """
+    whole = (sums == np.rint(sums)).tolist()
+    return [int(v) if w else v for v, w in zip(sums.tolist(), whole)]
+
+
+@ttl_cache(ttl=300)
+async def fetch_protocol_fees(slug):
+    """
+    Fetch historical fees and revenue for a protocol.
+
+    Memoized because protocols listed as both perps and options (e.g. Aevo)
+    would otherwise be fetched and parsed twice per run.
+    """
     print(f"  Fetching fees/revenue for {slug}...")
-    data = api_get(f"{BASE_URL}/summary/fees/{slug}")
+    data = await api_get(f"{BASE_URL}/summary/fees/{slug}")
     if not data:
         return None
 
     fees_chart = _extract_chart_data(data, "totalDataChart")
 
     # Try to extract fees vs revenue from breakdown
-    breakdown = data.get("totalDataChartBreakdown", [])
-    daily_fees = {}
-    daily_revenue = {}
-    for entry in breakdown:
-        if isinstance(entry, list) and len(entry) >= 2:
-            date = ts_to_date(entry[0])
-            vals = entry[1] if isinstance(entry[1], dict) else {}
-            # DefiLlama breakdown has chain-level data, sum them
-            fee_sum = 0
-            rev_sum = 0
-            for chain_data in vals.values():
-                if isinstance(chain_data, dict):
-                    fee_sum += chain_data.get("dailyFees", 0) or 0
-                    rev_sum += chain_data.get("dailyRevenue", 0) or 0
-                elif isinstance(chain_data, (int, float)):
-                    fee_sum += chain_data
-            daily_fees[date] = fee_sum if fee_sum else fees_chart.get(date, 0)
-            daily_revenue[date] = rev_sum
+    breakdown = [
+        entry for entry in data.get("totalDataChartBreakdown", [])
+        if isinstance(entry, list) and len(entry) >= 2
+    ]
+    # DefiLlama breakdown has chain-level data. Flatten every chain entry
+    # into one list tagged with its row, then sum per row with bincount.
+    chain_rows = []
+    chain_index = []
+    plain_fees = np.zeros(len(breakdown))
+    for i, entry in enumerate(breakdown):
+        vals = entry[1] if isinstance(entry[1], dict) else {}
+        for chain_data in vals.values():
+            if isinstance(chain_data, dict):
+                chain_rows.append(chain_data)
+                chain_index.append(i)
+            elif isinstance(chain_data, (int, float)):
+                plain_fees[i] += chain_data
+    chain_index = np.array(chain_index, dtype=np.intp)
+    fee_sums = plain_fees + np.bincount(
+        chain_index, weights=field_column(chain_rows, "dailyFees"), minlength=len(breakdown))
+    rev_sums = np.bincount(
+        chain_index, weights=field_column(chain_rows, "dailyRevenue"), minlength=len(breakdown))
+
+    dates = ts_to_dates([entry[0] for entry in breakdown])
+    daily_fees = {
+        date: fee_sum if fee_sum else fees_chart.get(date, 0)
+        for date, fee_sum in zip(dates, _json_sums(fee_sums))
+    }
+    daily_revenue = dict(zip(dates, _json_sums(rev_sums)))
 
     # If breakdown didn't yield revenue, use top-level data
     if not any(daily_revenue.values()):
@@ -190,10 +230,10 @@ def fetch_protocol_fees(slug):
     }
 
 
-def fetch_fees_overview():
+async def fetch_fees_overview():
     """Fetch overview of all protocol fees/revenue."""
     print("Fetching DefiLlama fees overview...")
-    data = api_get(f"{BASE_URL}/overview/fees")
+    data = await api_get(f"{BASE_URL}/overview/fees")
     if not data:
         return None
 
@@ -214,18 +254,19 @@ def fetch_fees_overview():
     return result
 
 
-def fetch_protocol_tvl(slug):
+async def fetch_protocol_tvl(slug):
     """Fetch TVL history for a protocol."""
     print(f"  Fetching TVL for {slug}...")
-    data = api_get(f"{BASE_URL}/protocol/{slug}")
+    data = await api_get(f"{BASE_URL}/protocol/{slug}", keys=TVL_KEYS)
     if not data:
         return None
 
-    tvl_history = {}
-    for entry in data.get("tvl", []):
-        if isinstance(entry, dict):
-            date = ts_to_date(entry.get("date", 0))
-            tvl_history[date] = entry.get("totalLiquidityUSD", 0)
+    entries = [entry for entry in data.get("tvl", []) if isinstance(entry, dict)]
+    dates = ts_to_dates([entry.get("date", 0) for entry in entries])
+    tvl_history = {
+        date: entry.get("totalLiquidityUSD", 0)
+        for date, entry in zip(dates, entries)
+    }
 
     return {
         "name": data.get("name", slug),
@@ -236,20 +277,43 @@ def fetch_protocol_tvl(slug):
     }
 
 
-def fetch_all_perps_data():
+def _drop_errors(slug, results):
+    """
+    Replace exceptions from a protocol's gathered requests with None (the
+    same as a failed request), so one bad response only blanks that part
+    of that protocol instead of failing the whole collector.
+    """
+    for result in results:
+        if isinstance(result, BaseException):
+            print(f"  Error fetching data for {slug}: {result!r}")
+    return [None if isinstance(result, BaseException) else result for result in results]
+
+
+async def fetch_all_perps_data():
     """Fetch volume, fees, revenue, and TVL for all tracked perps protocols."""
     print("\n=== Fetching Perps Data ===")
     results = {}
 
-    for slug, display_name in PERPS_PROTOCOLS.items():
-        print(f"\nProcessing {display_name} ({slug})...")
+    # Volume, fees and TVL for every protocol are independent requests
+    print(f"Fetching {len(PERPS_PROTOCOLS)} protocols concurrently...")
+    fetched = await asyncio.gather(*(
+        asyncio.gather(
+            fetch_perps_protocol_volume(slug),
+            fetch_protocol_fees(slug),
+            fetch_protocol_tvl(slug),
+            return_exceptions=True,
+        )
+        for slug in PERPS_PROTOCOLS
+    ))
+
+    for (slug, display_name), settled in zip(PERPS_PROTOCOLS.items(), fetched):
+        vol, fees, tvl = _drop_errors(slug, settled)
         proto_data = {
             "displayName": display_name,
             "slug": slug,
         }
 
         # Volume
-        vol = fetch_perps_protocol_volume(slug)
         if vol:
             proto_data["volumeHistory"] = vol["totalHistory"]
             proto_data["volume24h"] = vol.get("total24h", 0)
@@ -264,7 +328,6 @@ def fetch_all_perps_data():
             proto_data["volume24h"] = 0
 
         # Fees/Revenue
-        fees = fetch_protocol_fees(slug)
         if fees:
             proto_data["feesHistory"] = fees["dailyFees"]
             proto_data["revenueHistory"] = fees["dailyRevenue"]
@@ -277,7 +340,6 @@ def fetch_all_perps_data():
             proto_data["revenue24h"] = 0
 
         # TVL
-        tvl = fetch_protocol_tvl(slug)
         if tvl:
             proto_data["tvlHistory"] = tvl["tvlHistory"]
             proto_data["currentTvl"] = tvl.get("currentTvl", 0)
@@ -290,38 +352,65 @@ def fetch_all_perps_data():
     return results
 
 
-def fetch_all_options_data():
+def _fetch_options_slug(slug):
+    """Start the options volume and fees requests for one protocol."""
+    return asyncio.gather(
+        fetch_options_protocol(slug),
+        fetch_protocol_fees(slug),
+        return_exceptions=True,
+    )
+
+
+async def fetch_all_options_data():
     """Fetch volume and fee data for all tracked options protocols."""
     print("\n=== Fetching Options Data ===")
 
-    # Get overview first
-    overview = fetch_options_overview()
+    # Known protocols don't depend on the overview, so start them while it loads
+    pending = {slug: _fetch_options_slug(slug) for slug in OPTIONS_PROTOCOLS}
+    try:
+        overview = await fetch_options_overview()
+
+        # Index overview entries by slug once instead of scanning them per protocol
+        overview_by_slug = {}
+        if overview:
+            for pdata in overview.get("protocols", {}).values():
+                overview_by_slug.setdefault(pdata.get("slug", "").lower(), pdata)
+
+        # Resolve each slug to fetch into (display name, overview entry) up front
+        targets = {
+            slug: (name, overview_by_slug.get(slug))
+            for slug, name in OPTIONS_PROTOCOLS.items()
+        }
+
+        # Also add any protocols found in overview that we haven't listed
+        if overview:
+            for name, pdata in overview.get("protocols", {}).items():
+                slug = pdata.get("slug", "").lower()
+                if slug and slug not in targets and pdata.get("hasModule"):
+                    # Only add if it has meaningful volume
+                    if (pdata.get("total24h", 0) or 0) > 10000:
+                        targets[slug] = (name, overview_by_slug[slug])
+                        pending[slug] = _fetch_options_slug(slug)
+    except BaseException:
+        # Don't leave the protocol requests started above running unawaited
+        for gathered in pending.values():
+            gathered.cancel()
+        await asyncio.gather(*pending.values(), return_exceptions=True)
+        raise
 
     results = {}
-    # Fetch individual protocol data
-    slugs_to_fetch = set(OPTIONS_PROTOCOLS.keys())
-
-    # Also add any protocols found in overview that we haven't listed
-    if overview:
-        for name, pdata in overview.get("protocols", {}).items():
-            slug = pdata.get("slug", "").lower()
-            if slug and slug not in slugs_to_fetch:
-                # Only add if it has meaningful volume
-                if (pdata.get("total24h", 0) or 0) > 10000:
-                    slugs_to_fetch.add(slug)
-                    OPTIONS_PROTOCOLS[slug] = name
-
-    for slug in slugs_to_fetch:
-        display_name = OPTIONS_PROTOCOLS.get(slug, slug)
-        print(f"\nProcessing {display_name} ({slug})...")
 
+    print(f"Fetching {len(targets)} protocols concurrently...")
+    fetched = await asyncio.gather(*(pending[slug] for slug in targets))
+
+    for (slug, (display_name, pdata)), settled in zip(targets.items(), fetched):
+        opt, fees = _drop_errors(slug, settled)
         proto_data = {
             "displayName": display_name,
             "slug": slug,
         }
 
         # Volume from options endpoint
-        opt = fetch_options_protocol(slug)
         if opt:
             proto_data["volumeHistory"] = opt["totalHistory"]
             proto_data["volume24h"] = opt.get("total24h", 0)
@@ -332,16 +421,12 @@ def fetch_all_options_data():
             proto_data["volumeAllTime"] = 0
 
         # Add overview data if available
-        if overview:
-            for name, pdata in overview.get("protocols", {}).items():
-                if pdata.get("slug", "").lower() == slug:
-                    proto_data["notionalVolume24h"] = pdata.get("dailyNotionalVolume", 0)
-                    proto_data["premiumVolume24h"] = pdata.get("dailyPremiumVolume", 0)
-                    proto_data["volume24h"] = proto_data.get("volume24h") or pdata.get("total24h", 0)
-                    break
+        if pdata:
+            proto_data["notionalVolume24h"] = pdata.get("dailyNotionalVolume", 0)
+            proto_data["premiumVolume24h"] = pdata.get("dailyPremiumVolume", 0)
+            proto_data["volume24h"] = proto_data.get("volume24h") or pdata.get("total24h", 0)
 
         # Fees/Revenue
-        fees = fetch_protocol_fees(slug)
         if fees:
             proto_data["feesHistory"] = fees["dailyFees"]
             proto_data["revenueHistory"] = fees["dailyRevenue"]
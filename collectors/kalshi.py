@@ -4,13 +4,56 @@ Kalshi API collector for prediction market data.
 Uses the public trade API v2 for market data, volume, and trade history.
 """
 
-from collectors import api_get
+import asyncio
+import heapq
+import itertools
+import operator
+import re
+
+import numpy as np
+
+from collectors import api_get, field_column, select_fields
 
 BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 
+# Market fields the classifiers and aggregation actually read
+MARKET_FIELDS = frozenset({"title", "subtitle", "volume", "volume_24h", "open_interest"})
+
+CRYPTO_KEYWORDS = [
+    "bitcoin", "btc", "ethereum", "eth", "crypto", "solana", "sol",
+    "xrp", "ripple", "dogecoin", "doge", "cardano", "ada",
+    "polygon", "matic", "avalanche", "avax", "chainlink", "link",
+    "polkadot", "dot", "uniswap", "uni", "litecoin", "ltc",
+    "binance", "bnb", "tether", "usdt", "usdc", "stablecoin",
+    "defi", "nft", "blockchain", "token", "altcoin", "memecoin",
+]
+PRICE_KEYWORDS = [
+    "price", "above", "below", "reach", "hit", "trade at",
+    "end above", "end below", "close above", "close below",
+    "higher than", "lower than", "between",
+]
+
+
+def _keyword_pattern(keywords):
+    """Compile lowercase keywords into one substring alternation."""
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
+# Matched in a single pass over the lowercased title instead of one scan per
+# keyword. Lowercasing once and matching case-sensitively is several times
+# faster than re.IGNORECASE.
+_CRYPTO_RE = _keyword_pattern(CRYPTO_KEYWORDS)
+_PRICE_RE = _keyword_pattern(PRICE_KEYWORDS)
+
+
+async def fetch_markets(status="open", limit=200, cursor=None, event_ticker=None, series_ticker=None,
+                        fields=MARKET_FIELDS):
+    """
+    Fetch markets from Kalshi.
 
-def fetch_markets(status="open", limit=200, cursor=None, event_ticker=None, series_ticker=None):
-    """Fetch markets from Kalshi."""
+    Each market is trimmed to `fields` (pass None to keep everything), so
+    rules text, prices and other unused fields aren't carried past this point.
+    """
     params = {
         "limit": min(limit, 1000),
         "status": status,
@@ -22,15 +65,17 @@ def fetch_markets(status="open", limit=200, cursor=None, event_ticker=None, seri
     if series_ticker:
         params["series_ticker"] = series_ticker
 
-    data = api_get(f"{BASE_URL}/markets", params=params)
+    data = await api_get(f"{BASE_URL}/markets", params=params)
     if not data:
         return [], None
     markets = data.get("markets", [])
+    if fields is not None:
+        markets = select_fields(markets, fields)
     next_cursor = data.get("cursor", None)
     return markets, next_cursor
 
 
-def fetch_events(status=None, series_ticker=None, limit=200, cursor=None):
+async def fetch_events(status=None, series_ticker=None, limit=200, cursor=None):
     """Fetch events from Kalshi."""
     params = {"limit": min(limit, 200)}
     if status:
@@ -40,7 +85,7 @@ def fetch_events(status=None, series_ticker=None, limit=200, cursor=None):
     if cursor:
         params["cursor"] = cursor
 
-    data = api_get(f"{BASE_URL}/events", params=params)
+    data = await api_get(f"{BASE_URL}/events", params=params)
     if not data:
         return [], None
     events = data.get("events", [])
@@ -48,96 +93,168 @@ def fetch_events(status=None, series_ticker=None, limit=200, cursor=None):
     return events, next_cursor
 
 
-def _sum_market_volume(markets):
-    """Sum volume and OI across markets."""
-    total_volume = 0
-    total_volume_24h = 0
-    total_oi = 0
-    for m in markets:
-        total_volume += int(m.get("volume", 0) or 0)
-        total_volume_24h += int(m.get("volume_24h", 0) or 0)
-        total_oi += int(m.get("open_interest", 0) or 0)
+async def _paginate_markets(status, max_pages=None, max_markets=None):
+    """
+    Yield pages of markets with the given status, following the cursor.
+
+    The next page is requested as soon as the current page's cursor is
+    known, so it is already in flight while the caller processes this one.
+    Stops after `max_pages` pages or once more than `max_markets` markets
+    have been yielded.
+    """
+    pending = asyncio.ensure_future(fetch_markets(status=status, limit=1000))
+    pages = 0
+    count = 0
+    try:
+        while pending is not None:
+            markets, cursor = await pending
+            pending = None
+            if not markets:
+                return
+            pages += 1
+            count += len(markets)
+            if (cursor and (max_pages is None or pages < max_pages)
+                    and (max_markets is None or count <= max_markets)):
+                pending = asyncio.ensure_future(
+                    fetch_markets(status=status, limit=1000, cursor=cursor))
+            yield markets
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def _volume_stats(volume, volume_24h, open_interest, rows=slice(None)):
+    """Sum volume and OI over the selected rows (a slice or boolean mask) of the columns."""
     return {
-        "totalContracts": total_volume,
-        "contracts24h": total_volume_24h,
-        "openInterest": total_oi,
+        "totalContracts": volume[rows].sum().item(),
+        "contracts24h": volume_24h[rows].sum().item(),
+        "openInterest": open_interest[rows].sum().item(),
     }
 
 
+def _market_text(market):
+    """Lowercased title and subtitle of a market, as matched by the keyword classifiers."""
+    return (market.get("title", "") + " " + market.get("subtitle", "")).lower()
+
+
+def _is_crypto_text(text):
+    """Whether a market's lowercased text mentions crypto."""
+    return _CRYPTO_RE.search(text) is not None
+
+
+def _is_price_text(text):
+    """Whether a market's lowercased text reads like a price target."""
+    return _PRICE_RE.search(text) is not None
+
+
 def _is_crypto_market(market):
     """Determine if a market is crypto-related based on title/category."""
-    title = (market.get("title", "") + " " + market.get("subtitle", "")).lower()
-    crypto_keywords = [
-        "bitcoin", "btc", "ethereum", "eth", "crypto", "solana", "sol",
-        "xrp", "ripple", "dogecoin", "doge", "cardano", "ada",
-        "polygon", "matic", "avalanche", "avax", "chainlink", "link",
-        "polkadot", "dot", "uniswap", "uni", "litecoin", "ltc",
-        "binance", "bnb", "tether", "usdt", "usdc", "stablecoin",
-        "defi", "nft", "blockchain", "token", "altcoin", "memecoin",
-    ]
-    return any(kw in title for kw in crypto_keywords)
+    return _is_crypto_text(_market_text(market))
 
 
 def _is_price_prediction(market):
     """Determine if a market is specifically a price prediction (binary option on price)."""
-    title = (market.get("title", "") + " " + market.get("subtitle", "")).lower()
-    price_keywords = [
-        "price", "above", "below", "reach", "hit", "trade at",
-        "end above", "end below", "close above", "close below",
-        "higher than", "lower than", "between",
-    ]
-    return _is_crypto_market(market) and any(kw in title for kw in price_keywords)
+    text = _market_text(market)
+    return _is_crypto_text(text) and _is_price_text(text)
 
 
-def fetch_all_kalshi_data():
+def _aggregate_markets(markets, top_n=20):
+    """
+    Classify and total one page of markets in a single pass.
+
+    Each title is classified once, and the volume columns are built once
+    and reduced with masks for the crypto and price-prediction subsets.
+    Only the totals and the page's top crypto candidates are kept, so the
+    page itself can be dropped as soon as it has been folded in.
+    """
+    is_crypto = np.zeros(len(markets), dtype=bool)
+    is_price = np.zeros(len(markets), dtype=bool)
+    for i, m in enumerate(markets):
+        text = _market_text(m)  # built once, shared by both classifiers
+        if _is_crypto_text(text):
+            is_crypto[i] = True
+            is_price[i] = _is_price_text(text)
+
+    volume, volume_24h, open_interest = (
+        field_column(markets, field, np.int64)
+        for field in ("volume", "volume_24h", "open_interest")
+    )
+    columns = (volume, volume_24h, open_interest)
+
+    # Top crypto markets by volume without sorting the whole crypto subset
+    top = heapq.nlargest(top_n, np.flatnonzero(is_crypto).tolist(), key=volume.__getitem__)
+
+    return {
+        "markets": len(markets),
+        "totalStats": _volume_stats(*columns),
+        "cryptoStats": _volume_stats(*columns, is_crypto),
+        "priceStats": _volume_stats(*columns, is_price),
+        "cryptoMarkets": int(is_crypto.sum()),
+        "pricePredictionMarkets": int(is_price.sum()),
+        "topCryptoMarkets": [
+            {
+                "title": markets[i].get("title", ""),
+                "subtitle": markets[i].get("subtitle", ""),
+                "volume": volume[i].item(),
+                "volume24h": volume_24h[i].item(),
+                "openInterest": open_interest[i].item(),
+                "isPricePrediction": bool(is_price[i]),
+            }
+            for i in top
+        ],
+    }
+
+
+def _merge_aggregates(aggregates, top_n=20):
+    """Combine per-page aggregates (in page order) into one."""
+    merged = {
+        key: sum(agg[key] for agg in aggregates)
+        for key in ("markets", "cryptoMarkets", "pricePredictionMarkets")
+    }
+    for key in ("totalStats", "cryptoStats", "priceStats"):
+        merged[key] = {
+            stat: sum(agg[key][stat] for agg in aggregates)
+            for stat in ("totalContracts", "contracts24h", "openInterest")
+        }
+    # Candidates arrive in page order, so ties keep their original order
+    merged["topCryptoMarkets"] = heapq.nlargest(
+        top_n,
+        itertools.chain.from_iterable(agg["topCryptoMarkets"] for agg in aggregates),
+        key=operator.itemgetter("volume"),
+    )
+    return merged
+
+
+async def _aggregate_pages(status, **limits):
+    """Walk the markets with the given status, aggregating each page as it arrives."""
+    return [_aggregate_markets(markets) async for markets in _paginate_markets(status, **limits)]
+
+
+async def fetch_all_kalshi_data():
     """Fetch comprehensive Kalshi market data."""
     print("\n=== Fetching Kalshi Data ===")
 
-    # Fetch all open markets (paginate)
+    # Open markets (paginate) and recently closed ones (for volume data) are
+    # independent cursor walks, so run them side by side, folding each page
+    # in as it arrives
     print("  Fetching all open markets...")
-    all_markets = []
-    cursor = None
-    while True:
-        markets, cursor = fetch_markets(status="open", limit=1000, cursor=cursor)
-        if not markets:
-            break
-        all_markets.extend(markets)
-        if not cursor:
-            break
-        # Safety limit
-        if len(all_markets) > 10000:
-            break
-
-    # Also get recently closed for volume data
     print("  Fetching recently closed markets...")
-    closed_markets = []
-    cursor = None
-    page_count = 0
-    while page_count < 5:  # limit pages for closed markets
-        markets, cursor = fetch_markets(status="closed", limit=1000, cursor=cursor)
-        if not markets:
-            break
-        closed_markets.extend(markets)
-        page_count += 1
-        if not cursor:
-            break
-
-    all_combined = all_markets + closed_markets
-    print(f"  Total markets: {len(all_combined)} ({len(all_markets)} open, {len(closed_markets)} closed)")
-
-    # Calculate totals
-    total_stats = _sum_market_volume(all_combined)
-    open_stats = _sum_market_volume(all_markets)
-
-    # Filter crypto markets
-    crypto_markets = [m for m in all_combined if _is_crypto_market(m)]
-    price_prediction_markets = [m for m in all_combined if _is_price_prediction(m)]
-
-    crypto_stats = _sum_market_volume(crypto_markets)
-    price_stats = _sum_market_volume(price_prediction_markets)
-
-    print(f"  Crypto markets: {len(crypto_markets)}, Volume: {crypto_stats['totalContracts']} contracts")
-    print(f"  Price predictions: {len(price_prediction_markets)}, Volume: {price_stats['totalContracts']} contracts")
+    open_pages, closed_pages = await asyncio.gather(
+        _aggregate_pages("open", max_markets=10000),
+        _aggregate_pages("closed", max_pages=5),  # limit pages for closed markets
+    )
+
+    open_agg = _merge_aggregates(open_pages)
+    agg = _merge_aggregates(open_pages + closed_pages)
+    open_count = open_agg["markets"]
+    print(f"  Total markets: {agg['markets']} ({open_count} open, {agg['markets'] - open_count} closed)")
+
+    total_stats = agg["totalStats"]
+    crypto_stats = agg["cryptoStats"]
+    price_stats = agg["priceStats"]
+
+    print(f"  Crypto markets: {agg['cryptoMarkets']}, Volume: {crypto_stats['totalContracts']} contracts")
+    print(f"  Price predictions: {agg['pricePredictionMarkets']}, Volume: {price_stats['totalContracts']} contracts")
 
     # Percentage calculations
     crypto_pct = 0
@@ -146,28 +263,16 @@ def fetch_all_kalshi_data():
         crypto_pct = (crypto_stats["totalContracts"] / total_stats["totalContracts"]) * 100
         price_pct = (price_stats["totalContracts"] / total_stats["totalContracts"]) * 100
 
-    # Top crypto markets
-    top_crypto = []
-    for m in sorted(crypto_markets, key=lambda x: int(x.get("volume", 0) or 0), reverse=True)[:20]:
-        top_crypto.append({
-            "title": m.get("title", ""),
-            "subtitle": m.get("subtitle", ""),
-            "volume": int(m.get("volume", 0) or 0),
-            "volume24h": int(m.get("volume_24h", 0) or 0),
-            "openInterest": int(m.get("open_interest", 0) or 0),
-            "isPricePrediction": _is_price_prediction(m),
-        })
-
     return {
         "totalStats": total_stats,
-        "openStats": open_stats,
+        "openStats": open_agg["totalStats"],
         "cryptoStats": crypto_stats,
         "priceStats": price_stats,
         "cryptoPct": round(crypto_pct, 2),
         "pricePredictionPct": round(price_pct, 2),
-        "totalMarkets": len(all_combined),
-        "openMarkets": len(all_markets),
-        "cryptoMarkets": len(crypto_markets),
-        "pricePredictionMarkets": len(price_prediction_markets),
-        "topCryptoMarkets": top_crypto,
+        "totalMarkets": agg["markets"],
+        "openMarkets": open_count,
+        "cryptoMarkets": agg["cryptoMarkets"],
+        "pricePredictionMarkets": agg["pricePredictionMarkets"],
+        "topCryptoMarkets": agg["topCryptoMarkets"],
     }
@@ -5,7 +5,11 @@ Uses Gamma API for market metadata and volume,
 and CLOB API for price history.
 """
 
-from collectors import api_get
+import asyncio
+import heapq
+import itertools
+
+from collectors import api_get, select_fields, sum_fields, ttl_cache
 
 GAMMA_URL = "https://gamma-api.polymarket.com"
 CLOB_URL = "https://clob.polymarket.com"
@@ -13,18 +17,48 @@ CLOB_URL = "https://clob.polymarket.com"
 # Tag IDs for categories (discovered via /tags endpoint)
 CRYPTO_TAG_ID = "21"
 
+# Market pages requested concurrently per pagination round, and markets
+# requested per page (Gamma's maximum; fewer pages means fewer round trips)
+PAGE_WINDOW = 4
+MARKET_PAGE_SIZE = 500
+PAGE_CAP_STEP = 50  # servers cap `limit` at round numbers; other short pages end the list
+
+# Markets scanned for the overall and crypto totals. These match the
+# original 100-per-page walks up to offsets 5000 and 2000, so the counts
+# and totals don't depend on the page size.
+MAX_MARKETS = 5100
+MAX_CRYPTO_MARKETS = 2100
+
+# Market fields the aggregation and top-markets output actually read
+MARKET_FIELDS = frozenset({
+    "question", "closed", "volumeNum", "volume24hr", "volume1wk", "volume1mo", "liquidityNum",
+})
 
-def fetch_tags():
-    """Fetch all available tags/categories."""
+
+@ttl_cache(ttl=3600)
+async def fetch_tags():
+    """
+    Fetch all available tags/categories.
+
+    Labels rarely change, so they're kept in memory for an hour and on disk
+    (via CACHE_TTLS) across runs.
+    """
     print("  Fetching Polymarket tags...")
-    data = api_get(f"{GAMMA_URL}/tags", params={"limit": 200})
+    data = await api_get(f"{GAMMA_URL}/tags", params={"limit": 200})
     if not data:
         return []
+    if not isinstance(data, list) or not isinstance(data[0], dict):
+        raise ValueError(f"Unexpected /tags response: {type(data).__name__}")
     return data
 
 
-def fetch_markets(tag_id=None, closed=None, limit=100, offset=0):
-    """Fetch markets with optional tag filter."""
+async def fetch_markets(tag_id=None, closed=None, limit=100, offset=0, fields=MARKET_FIELDS):
+    """
+    Fetch markets with optional tag filter.
+
+    Each market is trimmed to `fields` (pass None to keep everything), so
+    descriptions, outcomes and token IDs aren't carried past this point.
+    """
     params = {
         "limit": limit,
         "offset": offset,
@@ -36,11 +70,15 @@ def fetch_markets(tag_id=None, closed=None, limit=100, offset=0):
     if closed is not None:
         params["closed"] = str(closed).lower()
 
-    data = api_get(f"{GAMMA_URL}/markets", params=params)
-    return data if data else []
+    data = await api_get(f"{GAMMA_URL}/markets", params=params)
+    if not data:
+        return []
+    if fields is None:
+        return data
+    return select_fields(data, fields)
 
 
-def fetch_events(tag_id=None, closed=None, limit=100, offset=0):
+async def fetch_events(tag_id=None, closed=None, limit=100, offset=0):
     """Fetch events with optional tag filter."""
     params = {
         "limit": limit,
@@ -51,70 +89,120 @@ def fetch_events(tag_id=None, closed=None, limit=100, offset=0):
     if closed is not None:
         params["closed"] = str(closed).lower()
 
-    data = api_get(f"{GAMMA_URL}/events", params=params)
+    data = await api_get(f"{GAMMA_URL}/events", params=params)
     return data if data else []
 
 
+async def _iter_market_pages(max_markets, tag_id=None, page_size=MARKET_PAGE_SIZE):
+    """
+    Yield pages of /markets covering at most the first `max_markets` markets.
+
+    The first page is fetched on its own, so a list that fits in one page
+    costs a single request. If it comes back short by a round number of
+    markets, the server may cap `limit` below `page_size`: the walk then
+    carries on at the server's page size, confirming with one more page
+    before fanning out. The rest are fetched PAGE_WINDOW pages at a time
+    and yielded in order, the last asking only for the markets left under
+    the cap; the walk stops at the first empty or short page, as a
+    sequential walk would. The window ending the walk may fetch up to
+    PAGE_WINDOW - 1 pages past the end, which are discarded.
+    """
+    limit = min(page_size, max_markets)
+    first = await fetch_markets(tag_id=tag_id, limit=limit, offset=0)
+    if not first:
+        return
+    yield first
+
+    offset = len(first)
+    window_size = PAGE_WINDOW
+    if offset < limit:
+        if offset % PAGE_CAP_STEP:
+            return
+        page_size, window_size = offset, 1
+    while offset < max_markets:
+        window = range(offset, max_markets, page_size)[:window_size]
+        limits = [min(page_size, max_markets - o) for o in window]
+        batches = await asyncio.gather(*(
+            fetch_markets(tag_id=tag_id, limit=limit, offset=o)
+            for o, limit in zip(window, limits)
+        ))
+        for limit, batch in zip(limits, batches):
+            if not batch:
+                return
+            yield batch
+            if len(batch) < limit:
+                return
+        offset = window[-1] + page_size
+        window_size = PAGE_WINDOW
+
+
+def _as_float(value):
+    """A numeric field as a float: JSON floats pass straight through, null becomes 0."""
+    return value if type(value) is float else float(value or 0)
+
+
+def _market_volume(market):
+    """Total volume of a market as a float."""
+    return _as_float(market.get("volumeNum"))
+
+
+async def _tally_markets(max_markets, tag_id=None, top_n=0):
+    """
+    Page through /markets, folding each page into running totals as it arrives.
+
+    Returns (volume totals, market count, top_n markets by volume). Pages are
+    dropped once folded in, so only the totals and top candidates are kept.
+    """
+    totals = None
+    count = 0
+    top = []
+    async for batch in _iter_market_pages(max_markets, tag_id=tag_id):
+        count += len(batch)
+        page = _sum_market_volume(batch)
+        totals = page if totals is None else {k: totals[k] + page[k] for k in totals}
+        if top_n:
+            # Earlier candidates come first, so ties keep their original order
+            top = heapq.nlargest(top_n, itertools.chain(top, batch), key=_market_volume)
+    return totals or _sum_market_volume([]), count, top
+
+
 def _sum_market_volume(markets):
-    """Sum volume across a list of markets."""
-    total = 0
-    total_24h = 0
-    total_1w = 0
-    total_1m = 0
-    for m in markets:
-        total += float(m.get("volumeNum", 0) or 0)
-        total_24h += float(m.get("volume24hr", 0) or 0)
-        total_1w += float(m.get("volume1wk", 0) or 0)
-        total_1m += float(m.get("volume1mo", 0) or 0)
+    """Sum volume and liquidity across a list of markets."""
+    totals = sum_fields(markets, ("volumeNum", "volume24hr", "volume1wk", "volume1mo", "liquidityNum"))
     return {
-        "total": total,
-        "volume24h": total_24h,
-        "volume1w": total_1w,
-        "volume1m": total_1m,
+        "total": totals["volumeNum"],
+        "volume24h": totals["volume24hr"],
+        "volume1w": totals["volume1wk"],
+        "volume1m": totals["volume1mo"],
+        "liquidity": totals["liquidityNum"],
     }
 
 
-def fetch_all_polymarket_data():
+async def fetch_all_polymarket_data():
     """Fetch comprehensive Polymarket data including crypto vs overall volume."""
     print("\n=== Fetching Polymarket Data ===")
 
-    # Fetch all markets (paginate to get totals)
-    print("  Fetching all markets for total volume...")
-    all_markets = []
-    offset = 0
-    batch_size = 100
-    while True:
-        batch = fetch_markets(limit=batch_size, offset=offset)
-        if not batch:
-            break
-        all_markets.extend(batch)
-        if len(batch) < batch_size:
-            break
-        offset += batch_size
-        # Safety limit
-        if offset > 5000:
-            break
-
-    total_volume = _sum_market_volume(all_markets)
-    print(f"  Total markets fetched: {len(all_markets)}, Total volume: ${total_volume['total']:,.0f}")
-
-    # Fetch crypto/price prediction markets
-    print("  Fetching crypto markets...")
-    crypto_markets = []
-    offset = 0
-    while True:
-        batch = fetch_markets(tag_id=CRYPTO_TAG_ID, limit=batch_size, offset=offset)
-        if not batch:
-            break
-        crypto_markets.extend(batch)
-        if len(batch) < batch_size:
-            break
-        offset += batch_size
-        if offset > 2000:
-            break
-
-    crypto_volume = _sum_market_volume(crypto_markets)
-    print(f"  Crypto markets: {len(crypto_markets)}, Crypto volume: ${crypto_volume['total']:,.0f}")
+    # Tags don't depend on the market walks, so fetch them alongside
+    tags_task = asyncio.ensure_future(fetch_tags())
+
+    try:
+        # Fetch all markets (paginate to get totals)
+        print("  Fetching all markets for total volume...")
+        total_volume, total_count, _ = await _tally_markets(MAX_MARKETS)
+        total_liquidity = total_volume.pop("liquidity")
+        print(f"  Total markets fetched: {total_count}, Total volume: ${total_volume['total']:,.0f}")
+
+        # Fetch crypto/price prediction markets
+        print("  Fetching crypto markets...")
+        crypto_volume, crypto_count, top_markets = await _tally_markets(
+            MAX_CRYPTO_MARKETS, tag_id=CRYPTO_TAG_ID, top_n=20)
+        crypto_liquidity = crypto_volume.pop("liquidity")
+        print(f"  Crypto markets: {crypto_count}, Crypto volume: ${crypto_volume['total']:,.0f}")
+    except BaseException:
+        # Don't leave the tags request running unawaited
+        tags_task.cancel()
+        await asyncio.gather(tags_task, return_exceptions=True)
+        raise
 
     # Calculate percentage
     price_pct = 0
@@ -123,31 +211,30 @@ def fetch_all_polymarket_data():
 
     # Get top crypto markets for detail
     top_crypto = []
-    for m in sorted(crypto_markets, key=lambda x: float(x.get("volumeNum", 0) or 0), reverse=True)[:20]:
+    for m in top_markets:
         top_crypto.append({
             "question": m.get("question", ""),
-            "volume": float(m.get("volumeNum", 0) or 0),
-            "volume24h": float(m.get("volume24hr", 0) or 0),
-            "liquidity": float(m.get("liquidityNum", 0) or 0),
+            "volume": _market_volume(m),
+            "volume24h": _as_float(m.get("volume24hr")),
+            "liquidity": _as_float(m.get("liquidityNum")),
             "closed": m.get("closed", False),
         })
 
     # Fetch tags for category breakdown
-    tags = fetch_tags()
-    tag_map = {}
-    if tags:
-        for t in tags:
-            if isinstance(t, dict):
-                tag_map[t.get("id", "")] = t.get("label", "")
+    try:
+        tag_map = {t["id"]: t["label"] for t in await tags_task}
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"  Skipping Polymarket categories: {e!r}")
+        tag_map = {}
 
     return {
         "totalVolume": total_volume,
         "cryptoVolume": crypto_volume,
         "pricePredictionPct": round(price_pct, 2),
-        "totalMarkets": len(all_markets),
-        "cryptoMarkets": len(crypto_markets),
+        "totalMarkets": total_count,
+        "cryptoMarkets": crypto_count,
         "topCryptoMarkets": top_crypto,
-        "totalLiquidity": sum(float(m.get("liquidityNum", 0) or 0) for m in all_markets),
-        "cryptoLiquidity": sum(float(m.get("liquidityNum", 0) or 0) for m in crypto_markets),
+        "totalLiquidity": total_liquidity,
+        "cryptoLiquidity": crypto_liquidity,
         "categories": tag_map,
     }
@@ -0,0 +1,47 @@
+"""
+Runs every collector concurrently.
+
+The collectors talk to independent hosts (DefiLlama, Polymarket, Kalshi),
+so total fetch time is roughly that of the slowest source rather than
+the sum of all of them.
+"""
+
+import asyncio
+
+from collectors.defillama import fetch_all_perps_data, fetch_all_options_data
+from collectors.polymarket import fetch_all_polymarket_data
+from collectors.kalshi import fetch_all_kalshi_data
+
+# Upper bound on a single collector, so one stuck host can't hold up the batch
+COLLECTOR_TIMEOUT = 180  # seconds
+
+# Collector for each data source, in the order results are returned
+COLLECTORS = {
+    "perps": fetch_all_perps_data,
+    "options": fetch_all_options_data,
+    "polymarket": fetch_all_polymarket_data,
+    "kalshi": fetch_all_kalshi_data,
+}
+
+
+async def _run_collector(name, collector, timeout):
+    """
+    Run one collector, returning None if it fails or doesn't finish within
+    `timeout`, so one broken source doesn't cost the others their data.
+    """
+    try:
+        return await asyncio.wait_for(collector(), timeout=timeout)
+    except asyncio.TimeoutError:
+        print(f"  Collector '{name}' timed out after {timeout}s")
+    except Exception as e:
+        print(f"  Collector '{name}' failed: {e!r}")
+    return None
+
+
+async def fetch_all(timeout=COLLECTOR_TIMEOUT):
+    """Fetch every data source concurrently. Returns { source: data }."""
+    results = await asyncio.gather(*(
+        _run_collector(name, collector, timeout)
+        for name, collector in COLLECTORS.items()
+    ))
+    return dict(zip(COLLECTORS, results))
@@ -503,10 +503,15 @@ function buildPredictionHistory(canvasId, history) {
     if (!ctx || !history || history.length === 0) return;
 
     const dates = history.map(h => h.date);
-    const polyVol = history.map(h => h.polymarket?.totalVolume || 0);
-    const polyCrypto = history.map(h => h.polymarket?.cryptoVolume || 0);
-    const kalshiVol = history.map(h => h.kalshi?.totalContracts || 0);
-    const kalshiCrypto = history.map(h => h.kalshi?.cryptoContracts || 0);
+    // Older history is stored as weekly means; draw those bars fainter and
+    // label them as weeks in the tooltip
+    const weekly = history.map(h => h.tier === "weekly");
+    const byTier = (daily, weeklyColor) => ctx => weekly[ctx.dataIndex] ? weeklyColor : daily;
+    // A source missing from a snapshot (its fetch failed) is a gap, not zero
+    const polyVol = history.map(h => h.polymarket ? h.polymarket.totalVolume || 0 : null);
+    const polyCrypto = history.map(h => h.polymarket ? h.polymarket.cryptoVolume || 0 : null);
+    const kalshiVol = history.map(h => h.kalshi ? h.kalshi.totalContracts || 0 : null);
+    const kalshiCrypto = history.map(h => h.kalshi ? h.kalshi.cryptoContracts || 0 : null);
 
     chartInstances[canvasId] = new Chart(ctx, {
         type: "bar",
@@ -516,7 +521,7 @@ function buildPredictionHistory(canvasId, history) {
                 {
                     label: "Polymarket — Total",
                     data: polyVol,
-                    backgroundColor: "#2C5BF4AA",
+                    backgroundColor: byTier("#2C5BF4AA", "#2C5BF455"),
                     borderColor: "#2C5BF4",
                     borderWidth: 1,
                     yAxisID: "y",
@@ -524,7 +529,7 @@ function buildPredictionHistory(canvasId, history) {
                 {
                     label: "Polymarket — Crypto",
                     data: polyCrypto,
-                    backgroundColor: "#2C5BF444",
+                    backgroundColor: byTier("#2C5BF444", "#2C5BF422"),
                     borderColor: "#2C5BF4",
                     borderWidth: 1,
                     borderDash: [4, 4],
@@ -533,7 +538,7 @@ function buildPredictionHistory(canvasId, history) {
                 {
                     label: "Kalshi — Total (contracts)",
                     data: kalshiVol,
-                    backgroundColor: "#FF6B35AA",
+                    backgroundColor: byTier("#FF6B35AA", "#FF6B3555"),
                     borderColor: "#FF6B35",
                     borderWidth: 1,
                     yAxisID: "y1",
@@ -541,7 +546,7 @@ function buildPredictionHistory(canvasId, history) {
                 {
                     label: "Kalshi — Crypto (contracts)",
                     data: kalshiCrypto,
-                    backgroundColor: "#FF6B3544",
+                    backgroundColor: byTier("#FF6B3544", "#FF6B3522"),
                     borderColor: "#FF6B35",
                     borderWidth: 1,
                     borderDash: [4, 4],
@@ -576,6 +581,9 @@ function buildPredictionHistory(canvasId, history) {
                 legend: { position: "bottom" },
                 tooltip: {
                     callbacks: {
+                        title: items => items.length
+                            ? (weekly[items[0].dataIndex] ? "Week of " : "") + items[0].label
+                            : "",
                         label: ctx => {
                             if (ctx.dataset.yAxisID === "y1") return ctx.dataset.label + ": " + fmtNum(ctx.parsed.y);
                             return ctx.dataset.label + ": " + fmtUSD(ctx.parsed.y);
@@ -685,8 +693,9 @@ function render() {
         kalshi.pricePredictionPct || 0, "Price Predictions"
     );
 
-    // Prediction history
-    buildPredictionHistory("predHistory", D.predictionHistory || []);
+    // Prediction history (from history.js; older data.js files embed it)
+    const predHistory = typeof PREDICTION_HISTORY !== "undefined" ? PREDICTION_HISTORY : D.predictionHistory;
+    buildPredictionHistory("predHistory", predHistory || []);
 
     // Tables
     renderPredictionTable("polymarketTable", poly.topCryptoMarkets, false);
@@ -0,0 +1,4 @@
+// Auto-generated by generate_sample_data.py — sample data for demonstration
+// Generated: 2026-02-23T21:50:59.844533+00:00
+// Run `python update_data.py` with internet access to fetch live data
+const PREDICTION_HISTORY = [{"date":"2025-11-26","polymarket":{"totalVolume":10926350316,"cryptoVolume":2317934320,"pricePredictionPct":21.21,"totalLiquidity":315000000},"kalshi":{"totalContracts":75419578,"cryptoContracts":3533076,"pricePredictionPct":3.91}},{"date":"2025-11-27","polymarket":{"totalVolume":10590900055,"cryptoVolume":2305991204,"pricePredictionPct":21.77,"totalLiquidity":315388889},"kalshi":{"totalContracts":79067566,"cryptoContracts":3670992,"pricePredictionPct":3.92}},{"date":"2025-11-28","polymarket":{"totalVolume":10695663269,"cryptoVolume":2183042438,"pricePredictionPct":20.41,"totalLiquidity":315777778},"kalshi":{"totalContracts":73795228,"cryptoContracts":3583486,"pricePredictionPct":3.92}},{"date":"2025-11-29","polymarket":{"totalVolume":10576875140,"cryptoVolume":2354393705,"pricePredictionPct":22.26,"totalLiquidity":316166667},"kalshi":{"totalContracts":78077277,"cryptoContracts":3540859,"pricePredictionPct":3.92}},{"date":"2025-11-30","polymarket":{"totalVolume":10837576309,"cryptoVolume":2148140081,"pricePredictionPct":19.82,"totalLiquidity":316555556},"kalshi":{"totalContracts":76453619,"cryptoContracts":3500026,"pricePredictionPct":3.92}},{"date":"2025-12-01","polymarket":{"totalVolume":10767759967,"cryptoVolume":2335468839,"pricePredictionPct":21.69,"totalLiquidity":316944444},"kalshi":{"totalContracts":75250692,"cryptoContracts":3595389,"pricePredictionPct":3.93}},{"date":"2025-12-02","polymarket":{"totalVolume":10587370140,"cryptoVolume":2247809723,"pricePredictionPct":21.23,"totalLiquidity":317333333},"kalshi":{"totalContracts":79918859,"cryptoContracts":3615864,"pricePredictionPct":3.93}},{"date":"2025-12-03","polymarket":{"totalVolume":10945014842,"cryptoVolume":2279149345,"pricePredictionPct":20.82,"totalLiquidity":317722222},"kalshi":{"totalContracts":78678336,"cryptoContracts":3695715,"pricePredictionPct":3.93}},{"date":"2025-12-04","polymarket":{"totalVolume":10734016968,"cryptoVolume":2266826654,"pricePredictionPct":21.12,"totalLiquidity":318111111},"kalshi":{"totalContracts":76326898,"cryptoContracts":3805942,"pricePredictionPct":3.93}},{"date":"2025-12-05","polymarket":{"totalVolume":10711914977,"cryptoVolume":2268864129,"pricePredictionPct":21.18,"totalLiquidity":318500000},"kalshi":{"totalContracts":75610394,"cryptoContracts":3521522,"pricePredictionPct":3.93}},{"date":"2025-12-06","polymarket":{"totalVolume":10908455024,"cryptoVolume":2368916131,"pricePredictionPct":21.72,"totalLiquidity":318888889},"kalshi":{"totalContracts":78280657,"cryptoContracts":3743971,"pricePredictionPct":3.94}},{"date":"2025-12-07","polymarket":{"totalVolume":10500839654,"cryptoVolume":2433718060,"pricePredictionPct":23.18,"totalLiquidity":319277778},"kalshi":{"totalContracts":76173430,"cryptoContracts":3613206,"pricePredictionPct":3.94}},{"date":"2025-12-08","polymarket":{"totalVolume":10970296530,"cryptoVolume":2208751108,"pricePredictionPct":20.13,"totalLiquidity":319666667},"kalshi":{"totalContracts":76204380,"cryptoContracts":3587829,"pricePredictionPct":3.94}},{"date":"2025-12-09","polymarket":{"totalVolume":10728318481,"cryptoVolume":2345460390,"pricePredictionPct":21.86,"totalLiquidity":320055556},"kalshi":{"totalContracts":77614136,"cryptoContracts":3460352,"pricePredictionPct":3.94}},{"date":"2025-12-10","polymarket":{"totalVolume":11066918952,"cryptoVolume":2236420363,"pricePredictionPct":20.21,"totalLiquidity":320444444},"kalshi":{"totalContracts":78948617,"cryptoContracts":3692766,"pricePredictionPct":3.95}},{"date":"2025-12-11","polymarket":{"totalVolume":11003836398,"cryptoVolume":2239815385,"pricePredictionPct":20.35,"totalLiquidity":320833333},"kalshi":{"totalContracts":75769206,"cryptoContracts":3460550,"pricePredictionPct":3.95}},{"date":"2025-12-12","polymarket":{"totalVolume":10781568271,"cryptoVolume":2301052032,"pricePredictionPct":21.34,"totalLiquidity":321222222},"kalshi":{"totalContracts":76140995,"cryptoContracts":3718690,"pricePredictionPct":3.95}},{"date":"2025-12-13","polymarket":{"totalVolume":11099857010,"cryptoVolume":2404997337,"pricePredictionPct":21.67,"totalLiquidity":321611111},"kalshi":{"totalContracts":79737703,"cryptoContracts":3751930,"pricePredictionPct":3.95}},{"date":"2025-12-14","polymarket":{"totalVolume":11142868718,"cryptoVolume":2308954158,"pricePredictionPct":20.72,"totalLiquidity":322000000},"kalshi":{"totalContracts":78649399,"cryptoContracts":3700998,"pricePredictionPct":3.96}},{"date":"2025-12-15","polymarket":{"totalVolume":11219589514,"cryptoVolume":2424269452,"pricePredictionPct":21.61,"totalLiquidity":322388889},"kalshi":{"totalContracts":77218848,"cryptoContracts":3910564,"pricePredictionPct":3.96}},{"date":"2025-12-16","polymarket":{"totalVolume":11074303959,"cryptoVolume":2330962728,"pricePredictionPct":21.05,"totalLiquidity":322777778},"kalshi":{"totalContracts":80907053,"cryptoContracts":3602815,"pricePredictionPct":3.96}},{"date":"2025-12-17","polymarket":{"totalVolume":10987686107,"cryptoVolume":2252181938,"pricePredictionPct":20.5,"totalLiquidity":323166667},"kalshi":{"totalContracts":81212463,"cryptoContracts":3738017,"pricePredictionPct":3.96}},{"date":"2025-12-18","polymarket":{"totalVolume":11204785329,"cryptoVolume":2487586467,"pricePredictionPct":22.2,"totalLiquidity":323555556},"kalshi":{"totalContracts":78916837,"cryptoContracts":3643938,"pricePredictionPct":3.96}},{"date":"2025-12-19","polymarket":{"totalVolume":10977498747,"cryptoVolume":2417299878,"pricePredictionPct":22.02,"totalLiquidity":323944444},"kalshi":{"totalContracts":77041837,"cryptoContracts":3649248,"pricePredictionPct":3.97}},{"date":"2025-12-20","polymarket":{"totalVolume":10828368275,"cryptoVolume":2380374533,"pricePredictionPct":21.98,"totalLiquidity":324333333},"kalshi":{"totalContracts":77034523,"cryptoContracts":3799782,"pricePredictionPct":3.97}},{"date":"2025-12-21","polymarket":{"totalVolume":10568513055,"cryptoVolume":2415987794,"pricePredictionPct":22.86,"totalLiquidity":324722222},"kalshi":{"totalContracts":78555756,"cryptoContracts":3877837,"pricePredictionPct":3.97}},{"date":"2025-12-22","polymarket":{"totalVolume":11397809391,"cryptoVolume":2321626880,"pricePredictionPct":20.37,"totalLiquidity":325111111},"kalshi":{"totalContracts":83253547,"cryptoContracts":3536142,"pricePredictionPct":3.97}},{"date":"2025-12-23","polymarket":{"totalVolume":11241722136,"cryptoVolume":2365556587,"pricePredictionPct":21.04,"totalLiquidity":325500000},"kalshi":{"totalContracts":79567676,"cryptoContracts":3730554,"pricePredictionPct":3.98}},{"date":"2025-12-24","polymarket":{"totalVolume":11354376688,"cryptoVolume":2418493969,"pricePredictionPct":21.3,"totalLiquidity":325888889},"kalshi":{"totalContracts":81118957,"cryptoContracts":3679376,"pricePredictionPct":3.98}},{"date":"2025-12-25","polymarket":{"totalVolume":10828131771,"cryptoVolume":2513735655,"pricePredictionPct":23.21,"totalLiquidity":326277778},"kalshi":{"totalContracts":78771506,"cryptoContracts":3791489,"pricePredictionPct":3.98}},{"date":"2025-12-26","polymarket":{"totalVolume":11262942901,"cryptoVolume":2351637200,"pricePredictionPct":20.88,"totalLiquidity":326666667},"kalshi":{"totalContracts":80387839,"cryptoContracts":3719930,"pricePredictionPct":3.98}},{"date":"2025-12-27","polymarket":{"totalVolume":11252479786,"cryptoVolume":2376911758,"pricePredictionPct":21.12,"totalLiquidity":327055556},"kalshi":{"totalContracts":79447086,"cryptoContracts":3619684,"pricePredictionPct":3.98}},{"date":"2025-12-28","polymarket":{"totalVolume":11062733106,"cryptoVolume":2508108587,"pricePredictionPct":22.67,"totalLiquidity":327444444},"kalshi":{"totalContracts":78777543,"cryptoContracts":3949688,"pricePredictionPct":3.99}},{"date":"2025-12-29","polymarket":{"totalVolume":11304358199,"cryptoVolume":2433309223,"pricePredictionPct":21.53,"totalLiquidity":327833333},"kalshi":{"totalContracts":77554951,"cryptoContracts":3856236,"pricePredictionPct":3.99}},{"date":"2025-12-30","polymarket":{"totalVolume":10970215541,"cryptoVolume":2314407243,"pricePredictionPct":21.1,"totalLiquidity":328222222},"kalshi":{"totalContracts":80526891,"cryptoContracts":4028571,"pricePredictionPct":3.99}},{"date":"2025-12-31","polymarket":{"totalVolume":11384390760,"cryptoVolume":2532862260,"pricePredictionPct":22.25,"totalLiquidity":328611111},"kalshi":{"totalContracts":81517639,"cryptoContracts":3711350,"pricePredictionPct":3.99}},{"date":"2026-01-01","polymarket":{"totalVolume":11442010308,"cryptoVolume":2439433568,"pricePredictionPct":21.32,"totalLiquidity":329000000},"kalshi":{"totalContracts":81613295,"cryptoContracts":3788198,"pricePredictionPct":4.0}},{"date":"2026-01-02","polymarket":{"totalVolume":11440390803,"cryptoVolume":2473271970,"pricePredictionPct":21.62,"totalLiquidity":329388889},"kalshi":{"totalContracts":80620360,"cryptoContracts":3748128,"pricePredictionPct":4.0}},{"date":"2026-01-03","polymarket":{"totalVolume":11069724837,"cryptoVolume":2531295980,"pricePredictionPct":22.87,"totalLiquidity":329777778},"kalshi":{"totalContracts":82952017,"cryptoContracts":3808215,"pricePredictionPct":4.0}},{"date":"2026-01-04","polymarket":{"totalVolume":11477249923,"cryptoVolume":2579494254,"pricePredictionPct":22.47,"totalLiquidity":330166667},"kalshi":{"totalContracts":79407433,"cryptoContracts":3812587,"pricePredictionPct":4.0}},{"date":"2026-01-05","polymarket":{"totalVolume":11178529324,"cryptoVolume":2724973118,"pricePredictionPct":24.38,"totalLiquidity":330555556},"kalshi":{"totalContracts":82742675,"cryptoContracts":3792471,"pricePredictionPct":4.01}},{"date":"2026-01-06","polymarket":{"totalVolume":11455305023,"cryptoVolume":2391824495,"pricePredictionPct":20.88,"totalLiquidity":330944444},"kalshi":{"totalContracts":82459498,"cryptoContracts":3846458,"pricePredictionPct":4.01}},{"date":"2026-01-07","polymarket":{"totalVolume":11331233638,"cryptoVolume":2343983137,"pricePredictionPct":20.69,"totalLiquidity":331333333},"kalshi":{"totalContracts":79474231,"cryptoContracts":3978816,"pricePredictionPct":4.01}},{"date":"2026-01-08","polymarket":{"totalVolume":11392376881,"cryptoVolume":2455521254,"pricePredictionPct":21.55,"totalLiquidity":331722222},"kalshi":{"totalContracts":84204157,"cryptoContracts":3978560,"pricePredictionPct":4.01}},{"date":"2026-01-09","polymarket":{"totalVolume":11648947430,"cryptoVolume":2504181666,"pricePredictionPct":21.5,"totalLiquidity":332111111},"kalshi":{"totalContracts":80738049,"cryptoContracts":4017099,"pricePredictionPct":4.01}},{"date":"2026-01-10","polymarket":{"totalVolume":11455827599,"cryptoVolume":2359474950,"pricePredictionPct":20.6,"totalLiquidity":332500000},"kalshi":{"totalContracts":79326245,"cryptoContracts":3923065,"pricePredictionPct":4.02}},{"date":"2026-01-11","polymarket":{"totalVolume":11604402302,"cryptoVolume":2448251733,"pricePredictionPct":21.1,"totalLiquidity":332888889},"kalshi":{"totalContracts":79427394,"cryptoContracts":3693007,"pricePredictionPct":4.02}},{"date":"2026-01-12","polymarket":{"totalVolume":11735871607,"cryptoVolume":2520814904,"pricePredictionPct":21.48,"totalLiquidity":333277778},"kalshi":{"totalContracts":79809190,"cryptoContracts":4037331,"pricePredictionPct":4.02}},{"date":"2026-01-13","polymarket":{"totalVolume":12130338917,"cryptoVolume":2564660109,"pricePredictionPct":21.14,"totalLiquidity":333666667},"kalshi":{"totalContracts":84518766,"cryptoContracts":3830959,"pricePredictionPct":4.02}},{"date":"2026-01-14","polymarket":{"totalVolume":11486109550,"cryptoVolume":2354441437,"pricePredictionPct":20.5,"totalLiquidity":334055556},"kalshi":{"totalContracts":78596637,"cryptoContracts":3931978,"pricePredictionPct":4.03}},{"date":"2026-01-15","polymarket":{"totalVolume":11606052232,"cryptoVolume":2639489094,"pricePredictionPct":22.74,"totalLiquidity":334444444},"kalshi":{"totalContracts":84687779,"cryptoContracts":3795093,"pricePredictionPct":4.03}},{"date":"2026-01-16","polymarket":{"totalVolume":12091182711,"cryptoVolume":2687635775,"pricePredictionPct":22.23,"totalLiquidity":334833333},"kalshi":{"totalContracts":78388632,"cryptoContracts":4002448,"pricePredictionPct":4.03}},{"date":"2026-01-17","polymarket":{"totalVolume":11413268640,"cryptoVolume":2540439817,"pricePredictionPct":22.26,"totalLiquidity":335222222},"kalshi":{"totalContracts":82099876,"cryptoContracts":4093087,"pricePredictionPct":4.03}},{"date":"2026-01-18","polymarket":{"totalVolume":12168725301,"cryptoVolume":2504539292,"pricePredictionPct":20.58,"totalLiquidity":335611111},"kalshi":{"totalContracts":82384577,"cryptoContracts":3882483,"pricePredictionPct":4.04}},{"date":"2026-01-19","polymarket":{"totalVolume":11539437834,"cryptoVolume":2662272777,"pricePredictionPct":23.07,"totalLiquidity":336000000},"kalshi":{"totalContracts":82524638,"cryptoContracts":3823241,"pricePredictionPct":4.04}},{"date":"2026-01-20","polymarket":{"totalVolume":11830214066,"cryptoVolume":2463153694,"pricePredictionPct":20.82,"totalLiquidity":336388889},"kalshi":{"totalContracts":80547316,"cryptoContracts":3743781,"pricePredictionPct":4.04}},{"date":"2026-01-21","polymarket":{"totalVolume":11834702652,"cryptoVolume":2597400394,"pricePredictionPct":21.95,"totalLiquidity":336777778},"kalshi":{"totalContracts":80639443,"cryptoContracts":3912157,"pricePredictionPct":4.04}},{"date":"2026-01-22","polymarket":{"totalVolume":11401893337,"cryptoVolume":2510307338,"pricePredictionPct":22.02,"totalLiquidity":337166667},"kalshi":{"totalContracts":82428273,"cryptoContracts":3987640,"pricePredictionPct":4.04}},{"date":"2026-01-23","polymarket":{"totalVolume":11830837961,"cryptoVolume":2628619026,"pricePredictionPct":22.22,"totalLiquidity":337555556},"kalshi":{"totalContracts":82222788,"cryptoContracts":3954437,"pricePredictionPct":4.05}},{"date":"2026-01-24","polymarket":{"totalVolume":12028325459,"cryptoVolume":2659199301,"pricePredictionPct":22.11,"totalLiquidity":337944444},"kalshi":{"totalContracts":84176048,"cryptoContracts":4092018,"pricePredictionPct":4.05}},{"date":"2026-01-25","polymarket":{"totalVolume":11918581573,"cryptoVolume":2451698418,"pricePredictionPct":20.57,"totalLiquidity":338333333},"kalshi":{"totalContracts":81318216,"cryptoContracts":4097620,"pricePredictionPct":4.05}},{"date":"2026-01-26","polymarket":{"totalVolume":12113915786,"cryptoVolume":2657223427,"pricePredictionPct":21.94,"totalLiquidity":338722222},"kalshi":{"totalContracts":86770452,"cryptoContracts":4056072,"pricePredictionPct":4.05}},{"date":"2026-01-27","polymarket":{"totalVolume":12077093469,"cryptoVolume":2570336006,"pricePredictionPct":21.28,"totalLiquidity":339111111},"kalshi":{"totalContracts":83401720,"cryptoContracts":3994674,"pricePredictionPct":4.06}},{"date":"2026-01-28","polymarket":{"totalVolume":11849008425,"cryptoVolume":2525820065,"pricePredictionPct":21.32,"totalLiquidity":339500000},"kalshi":{"totalContracts":83525115,"cryptoContracts":3899213,"pricePredictionPct":4.06}},{"date":"2026-01-29","polymarket":{"totalVolume":12174916400,"cryptoVolume":2693805046,"pricePredictionPct":22.13,"totalLiquidity":339888889},"kalshi":{"totalContracts":83471968,"cryptoContracts":3997646,"pricePredictionPct":4.06}},{"date":"2026-01-30","polymarket":{"totalVolume":11772266293,"cryptoVolume":2627333464,"pricePredictionPct":22.32,"totalLiquidity":340277778},"kalshi":{"totalContracts":84905910,"cryptoContracts":3973674,"pricePredictionPct":4.06}},{"date":"2026-01-31","polymarket":{"totalVolume":11528803741,"cryptoVolume":2616422149,"pricePredictionPct":22.69,"totalLiquidity":340666667},"kalshi":{"totalContracts":84145586,"cryptoContracts":4073163,"pricePredictionPct":4.07}},{"date":"2026-02-01","polymarket":{"totalVolume":12243448276,"cryptoVolume":2734251629,"pricePredictionPct":22.33,"totalLiquidity":341055556},"kalshi":{"totalContracts":85635843,"cryptoContracts":4124378,"pricePredictionPct":4.07}},{"date":"2026-02-02","polymarket":{"totalVolume":11882122091,"cryptoVolume":2529378768,"pricePredictionPct":21.29,"totalLiquidity":341444444},"kalshi":{"totalContracts":83113685,"cryptoContracts":4000632,"pricePredictionPct":4.07}},{"date":"2026-02-03","polymarket":{"totalVolume":11368232083,"cryptoVolume":2668701741,"pricePredictionPct":23.48,"totalLiquidity":341833333},"kalshi":{"totalContracts":81324611,"cryptoContracts":4182477,"pricePredictionPct":4.07}},{"date":"2026-02-04","polymarket":{"totalVolume":11880267558,"cryptoVolume":2715379925,"pricePredictionPct":22.86,"totalLiquidity":342222222},"kalshi":{"totalContracts":81333566,"cryptoContracts":4072659,"pricePredictionPct":4.07}},{"date":"2026-02-05","polymarket":{"totalVolume":12094659498,"cryptoVolume":2676783410,"pricePredictionPct":22.13,"totalLiquidity":342611111},"kalshi":{"totalContracts":84345458,"cryptoContracts":4006443,"pricePredictionPct":4.08}},{"date":"2026-02-06","polymarket":{"totalVolume":12530974034,"cryptoVolume":2573334751,"pricePredictionPct":20.54,"totalLiquidity":343000000},"kalshi":{"totalContracts":80844700,"cryptoContracts":4168069,"pricePredictionPct":4.08}},{"date":"2026-02-07","polymarket":{"totalVolume":11767428541,"cryptoVolume":2811448872,"pricePredictionPct":23.89,"totalLiquidity":343388889},"kalshi":{"totalContracts":84738342,"cryptoContracts":4140533,"pricePredictionPct":4.08}},{"date":"2026-02-08","polymarket":{"totalVolume":12016668065,"cryptoVolume":2902575040,"pricePredictionPct":24.15,"totalLiquidity":343777778},"kalshi":{"totalContracts":84933644,"cryptoContracts":4074062,"pricePredictionPct":4.08}},{"date":"2026-02-09","polymarket":{"totalVolume":12202025668,"cryptoVolume":2662536833,"pricePredictionPct":21.82,"totalLiquidity":344166667},"kalshi":{"totalContracts":88109870,"cryptoContracts":4012664,"pricePredictionPct":4.09}},{"date":"2026-02-10","polymarket":{"totalVolume":12237518826,"cryptoVolume":2629641315,"pricePredictionPct":21.49,"totalLiquidity":344555556},"kalshi":{"totalContracts":86447173,"cryptoContracts":4027521,"pricePredictionPct":4.09}},{"date":"2026-02-11","polymarket":{"totalVolume":11755609780,"cryptoVolume":2644586142,"pricePredictionPct":22.5,"totalLiquidity":344944444},"kalshi":{"totalContracts":82271904,"cryptoContracts":4177929,"pricePredictionPct":4.09}},{"date":"2026-02-12","polymarket":{"totalVolume":12351460401,"cryptoVolume":2578800490,"pricePredictionPct":20.88,"totalLiquidity":345333333},"kalshi":{"totalContracts":85654026,"cryptoContracts":4159539,"pricePredictionPct":4.09}},{"date":"2026-02-13","polymarket":{"totalVolume":12473224786,"cryptoVolume":2863623961,"pricePredictionPct":22.96,"totalLiquidity":345722222},"kalshi":{"totalContracts":86246028,"cryptoContracts":4279347,"pricePredictionPct":4.09}},{"date":"2026-02-14","polymarket":{"totalVolume":12412498130,"cryptoVolume":2740776018,"pricePredictionPct":22.08,"totalLiquidity":346111111},"kalshi":{"totalContracts":84143596,"cryptoContracts":4295377,"pricePredictionPct":4.1}},{"date":"2026-02-15","polymarket":{"totalVolume":12246637339,"cryptoVolume":2660378149,"pricePredictionPct":21.72,"totalLiquidity":346500000},"kalshi":{"totalContracts":83482078,"cryptoContracts":4046852,"pricePredictionPct":4.1}},{"date":"2026-02-16","polymarket":{"totalVolume":11872210130,"cryptoVolume":2682774496,"pricePredictionPct":22.6,"totalLiquidity":346888889},"kalshi":{"totalContracts":83093176,"cryptoContracts":4154108,"pricePredictionPct":4.1}},{"date":"2026-02-17","polymarket":{"totalVolume":12364605352,"cryptoVolume":2793216808,"pricePredictionPct":22.59,"totalLiquidity":347277778},"kalshi":{"totalContracts":84590041,"cryptoContracts":4404588,"pricePredictionPct":4.1}},{"date":"2026-02-18","polymarket":{"totalVolume":12583553537,"cryptoVolume":2796964228,"pricePredictionPct":22.23,"totalLiquidity":347666667},"kalshi":{"totalContracts":84481956,"cryptoContracts":3909465,"pricePredictionPct":4.11}},{"date":"2026-02-19","polymarket":{"totalVolume":12686463531,"cryptoVolume":2803435782,"pricePredictionPct":22.1,"totalLiquidity":348055556},"kalshi":{"totalContracts":87097850,"cryptoContracts":4179681,"pricePredictionPct":4.11}},{"date":"2026-02-20","polymarket":{"totalVolume":12207734855,"cryptoVolume":2787434058,"pricePredictionPct":22.83,"totalLiquidity":348444444},"kalshi":{"totalContracts":86367829,"cryptoContracts":4099178,"pricePredictionPct":4.11}},{"date":"2026-02-21","polymarket":{"totalVolume":12438658079,"cryptoVolume":2521271721,"pricePredictionPct":20.27,"totalLiquidity":348833333},"kalshi":{"totalContracts":82875560,"cryptoContracts":4311819,"pricePredictionPct":4.11}},{"date":"2026-02-22","polymarket":{"totalVolume":12401325404,"cryptoVolume":2721091040,"pricePredictionPct":21.94,"totalLiquidity":349222222},"kalshi":{"totalContracts":84926786,"cryptoContracts":4257630,"pricePredictionPct":4.12}},{"date":"2026-02-23","polymarket":{"totalVolume":12600107861,"cryptoVolume":2831583845,"pricePredictionPct":22.47,"totalLiquidity":349611111},"kalshi":{"totalContracts":87787536,"cryptoContracts":4253734,"pricePredictionPct":4.12}}];
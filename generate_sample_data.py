@@ -9,61 +9,113 @@ Run the real update_data.py when you have internet access to replace
 this with live data.
 """
 
-import json
-import math
 import os
-import random
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
+import orjson
+
 DASHBOARD_DIR = os.path.join(os.path.dirname(__file__), "dashboard")
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 
-random.seed(42)  # Reproducible
+_rng = np.random.default_rng(42)  # Reproducible
+
+# S-curves by (days, growth_start); see s_curve()
+_s_curves = {}
 
 
 def date_range(start_date, end_date):
     """Generate YYYY-MM-DD strings for a date range."""
-    dates = []
-    d = start_date
-    while d <= end_date:
-        dates.append(d.strftime("%Y-%m-%d"))
-        d += timedelta(days=1)
-    return dates
+    days = np.arange(
+        np.datetime64(start_date.date()), np.datetime64(end_date.date()) + 1, dtype="datetime64[D]",
+    )
+    return np.datetime_as_string(days).tolist()
 
 
-def growth_curve(n, base, peak, growth_start=0.3, noise=0.15):
+def s_curve(n, growth_start):
     """
-    Generate a growth curve with noise.
-    Starts slow, accelerates, with random daily variation.
-    """
-    vals = []
-    for i in range(n):
-        t = i / max(n - 1, 1)
-        # S-curve growth
-        if t < growth_start:
-            pct = (t / growth_start) * 0.1
-        else:
-            pct = 0.1 + 0.9 * ((t - growth_start) / (1 - growth_start)) ** 1.5
-        val = base + (peak - base) * pct
-        # Add noise
-        val *= 1 + random.gauss(0, noise)
-        # Add weekly seasonality (lower weekends)
-        day_of_week = i % 7
-        if day_of_week >= 5:
-            val *= 0.7
-        vals.append(max(0, val))
-    return vals
+    Fraction of the way from base to peak on each of `n` days: a slow ramp to
+    10% until `growth_start`, then accelerating growth.
 
+    `growth_start` may be a (protocols, 1) column, giving one row per
+    protocol. Memoized, since it depends only on `n` and `growth_start`;
+    callers must not modify it.
+    """
+    if np.ndim(growth_start):
+        return np.stack([s_curve(n, gs) for gs in np.ravel(growth_start).tolist()])
+    key = (n, growth_start)
+    if key not in _s_curves:
+        t = np.arange(n) / max(n - 1, 1)
+        # t only increases, so the ramp and the growth phase are two slices
+        # and each formula runs only over its own days
+        cut = int(np.searchsorted(t, growth_start))
+        pct = np.empty(n)
+        pct[:cut] = t[:cut] * (0.1 / growth_start)
+        x = (t[cut:] - growth_start) * (1 / (1 - growth_start))
+        pct[cut:] = 0.1 + 0.9 * x * np.sqrt(x)  # x ** 1.5
+        _s_curves[key] = pct
+    return _s_curves[key]
+
+
+def daily_noise(shape, noise):
+    """Multiplicative day-to-day variation: random noise plus lower weekends."""
+    vals = _rng.standard_normal(shape)
+    vals *= noise
+    vals += 1
+    vals[..., np.arange(shape[-1]) % 7 >= 5] *= 0.7
+    return np.maximum(vals, 0, out=vals)
+
+
+def rounded(vals):
+    """Round an array to whole numbers, as (nested) lists of Python ints."""
+    return np.rint(vals).astype(np.int64).tolist()
+
+
+def spike_multiplier(n, spike_points):
+    """Per-day multiplier combining every spike (market event) in `spike_points`."""
+    mult_by_day = np.ones(n)
+    for sp, mult in spike_points:
+        idx = int(sp * n)
+        lo, hi = max(0, idx - 3), min(n, idx + 5)
+        dist = np.abs(np.arange(lo, hi) - idx)
+        mult_by_day[lo:hi] *= 1 + (mult - 1) * np.maximum(0, 1 - dist / 5)
+    return mult_by_day
+
+
+def _config_column(cfgs, key):
+    """One config value per protocol, as a (protocols, 1) column."""
+    return np.array([cfg[key] for cfg in cfgs], dtype=float)[:, None]
+
+
+def _config_columns(cfgs, keys):
+    """Config values for several keys, as a (keys, protocols, 1) array."""
+    return np.array([[cfg[key] for cfg in cfgs] for key in keys], dtype=float)[:, :, None]
+
+
+def build_matrices(cfgs, metrics, n, noise, growth_start=0.3, spike_mult=None):
+    """
+    Series for each of `metrics` ("vol", "fee", "rev", "tvl") of every
+    protocol in `cfgs`, as one (metrics, protocols, n) array.
 
-def spike_growth(n, base, peak, spike_points=None, noise=0.2):
-    """Growth with occasional spikes (market events)."""
-    vals = growth_curve(n, base, peak, noise=noise)
-    if spike_points:
-        for sp, mult in spike_points:
-            idx = int(sp * n)
-            for j in range(max(0, idx - 3), min(n, idx + 5)):
-                dist = abs(j - idx)
-                vals[j] *= 1 + (mult - 1) * max(0, 1 - dist / 5)
+    Each protocol's metrics follow the same S-curve scaled between their own
+    base and peak, and share one draw of daily noise (and spikes), so they
+    move together. Each protocol's early days, before its own growth_start,
+    are zeroed.
+    """
+    pct = s_curve(n, growth_start)
+    factor = daily_noise((len(cfgs), n), noise)
+    if spike_mult is not None:
+        factor *= spike_mult
+    # Zero out early data for newer protocols
+    zero_until = (_config_column(cfgs, "growth_start") * n * 0.8).astype(int)
+    for row, days in zip(factor, zero_until.ravel().tolist()):
+        row[:days] = 0
+
+    # Every metric in one broadcast, built in place in a single allocation
+    base = _config_columns(cfgs, [f"base_{metric}" for metric in metrics])
+    vals = pct * (_config_columns(cfgs, [f"peak_{metric}" for metric in metrics]) - base)
+    vals += base
+    vals *= factor
     return vals
 
 
@@ -170,59 +222,61 @@ def main():
     }
 
     spike_events = [(0.45, 2.5), (0.6, 1.8), (0.75, 3.0), (0.88, 2.2), (0.95, 1.5)]
+    spike_mult = spike_multiplier(n, spike_events)
 
-    perps_volume_series = {}
-    perps_fees_series = {}
-    perps_revenue_series = {}
-    perps_tvl_series = {}
-    perps_proto_info = {}
+    perps_cfgs = list(perps_protocols.values())
+    perps_names = [cfg["displayName"] for cfg in perps_cfgs]
+    perps_vol, perps_fee, perps_rev = build_matrices(
+        perps_cfgs, ("vol", "fee", "rev"), n, noise=0.2, spike_mult=spike_mult,
+    )
+    perps_tvl, = build_matrices(
+        perps_cfgs, ("tvl",), n, noise=0.05,
+        growth_start=_config_column(perps_cfgs, "growth_start"),
+    )
+
+    perps_volume_series = dict(zip(perps_names, rounded(perps_vol)))
+    perps_fees_series = dict(zip(perps_names, rounded(perps_fee)))
+    perps_revenue_series = dict(zip(perps_names, rounded(perps_rev)))
+    perps_tvl_series = dict(zip(perps_names, rounded(perps_tvl)))
 
-    for slug, cfg in perps_protocols.items():
-        vol = spike_growth(n, cfg["base_vol"], cfg["peak_vol"], spike_events, noise=0.2)
-        fee = spike_growth(n, cfg["base_fee"], cfg["peak_fee"], spike_events, noise=0.2)
-        rev = spike_growth(n, cfg["base_rev"], cfg["peak_rev"], spike_events, noise=0.2)
-        tvl = growth_curve(n, cfg["base_tvl"], cfg["peak_tvl"], cfg["growth_start"], noise=0.05)
-
-        # Zero out early data for newer protocols
-        gs = cfg["growth_start"]
-        zero_until = int(gs * n * 0.8)
-        for i in range(zero_until):
-            vol[i] = 0
-            fee[i] = 0
-            rev[i] = 0
-            tvl[i] = 0
-
-        perps_volume_series[cfg["displayName"]] = [round(v) for v in vol]
-        perps_fees_series[cfg["displayName"]] = [round(v) for v in fee]
-        perps_revenue_series[cfg["displayName"]] = [round(v) for v in rev]
-        perps_tvl_series[cfg["displayName"]] = [round(v) for v in tvl]
-
-        # Current metrics (last day)
+    perps_proto_info = {}
+    for slug, cfg, vol, fee, rev, tvl in zip(
+        perps_protocols, perps_cfgs, perps_vol, perps_fee, perps_rev, perps_tvl,
+    ):
+        # Current metrics (last day). Trailing window sums come from one
+        # running total: the sum over days (i, j] is cs[j] - cs[i].
+        cs = vol.cumsum()
+        vol7 = cs[-1] - cs[-8]
+        vol30 = cs[-1] - cs[-31]
+        prev_vol7 = cs[-8] - cs[-15]
+        prev_vol30 = cs[-31] - cs[-61]
         perps_proto_info[slug] = {
             "displayName": cfg["displayName"],
             "volume24h": round(vol[-1]),
-            "volume7d": round(sum(vol[-7:])),
-            "volume30d": round(sum(vol[-30:])),
+            "volume7d": round(vol7),
+            "volume30d": round(vol30),
             "fees24h": round(fee[-1]),
             "revenue24h": round(rev[-1]),
             "currentTvl": round(tvl[-1]),
             "volumeChange1d": round((vol[-1] / max(vol[-2], 1) - 1) * 100, 1),
-            "volumeChange7d": round((sum(vol[-7:]) / max(sum(vol[-14:-7]), 1) - 1) * 100, 1),
-            "volumeChange1m": round((sum(vol[-30:]) / max(sum(vol[-60:-30]), 1) - 1) * 100, 1),
+            "volumeChange7d": round((vol7 / max(prev_vol7, 1) - 1) * 100, 1),
+            "volumeChange1m": round((vol30 / max(prev_vol30, 1) - 1) * 100, 1),
         }
 
-    # Compute market share
-    total_vol_24h = sum(p["volume24h"] for p in perps_proto_info.values())
-    perps_market_share = {}
-    for slug, p in perps_proto_info.items():
-        if p["volume24h"] > 0:
-            perps_market_share[p["displayName"]] = round((p["volume24h"] / total_vol_24h) * 100, 2)
+    # Compute market share and totals from each protocol's latest day,
+    # rounded the same way as its own figures above
+    vol_24h = np.rint(perps_vol[:, -1])
+    total_vol_24h = int(vol_24h.sum())
+    perps_market_share = {
+        name: round((v / total_vol_24h) * 100, 2)
+        for name, v in zip(perps_names, vol_24h.tolist()) if v > 0
+    }
 
     perps_metrics = {
         "volume24h": total_vol_24h,
-        "fees24h": sum(p["fees24h"] for p in perps_proto_info.values()),
-        "revenue24h": sum(p["revenue24h"] for p in perps_proto_info.values()),
-        "tvl": sum(p["currentTvl"] for p in perps_proto_info.values()),
+        "fees24h": int(np.rint(perps_fee[:, -1]).sum()),
+        "revenue24h": int(np.rint(perps_rev[:, -1]).sum()),
+        "tvl": int(np.rint(perps_tvl[:, -1]).sum()),
     }
 
     # ═══════════════════════════════════════════════════════════════
@@ -287,27 +341,20 @@ def main():
         },
     }
 
-    options_volume_series = {}
-    options_fees_series = {}
-    options_revenue_series = {}
-    options_proto_info = {}
-
-    for slug, cfg in options_protocols.items():
-        vol = spike_growth(n, cfg["base_vol"], cfg["peak_vol"], spike_events, noise=0.25)
-        fee = spike_growth(n, cfg["base_fee"], cfg["peak_fee"], spike_events, noise=0.25)
-        rev = spike_growth(n, cfg["base_rev"], cfg["peak_rev"], spike_events, noise=0.25)
-
-        gs = cfg["growth_start"]
-        zero_until = int(gs * n * 0.8)
-        for i in range(zero_until):
-            vol[i] = 0
-            fee[i] = 0
-            rev[i] = 0
+    options_cfgs = list(options_protocols.values())
+    options_names = [cfg["displayName"] for cfg in options_cfgs]
+    options_vol, options_fee, options_rev = build_matrices(
+        options_cfgs, ("vol", "fee", "rev"), n, noise=0.25, spike_mult=spike_mult,
+    )
 
-        options_volume_series[cfg["displayName"]] = [round(v) for v in vol]
-        options_fees_series[cfg["displayName"]] = [round(v) for v in fee]
-        options_revenue_series[cfg["displayName"]] = [round(v) for v in rev]
+    options_volume_series = dict(zip(options_names, rounded(options_vol)))
+    options_fees_series = dict(zip(options_names, rounded(options_fee)))
+    options_revenue_series = dict(zip(options_names, rounded(options_rev)))
 
+    options_proto_info = {}
+    for slug, cfg, vol, fee, rev in zip(
+        options_protocols, options_cfgs, options_vol, options_fee, options_rev,
+    ):
         options_proto_info[slug] = {
             "displayName": cfg["displayName"],
             "volume24h": round(vol[-1]),
@@ -315,19 +362,20 @@ def main():
             "premiumVolume24h": round(vol[-1] * 0.03),
             "fees24h": round(fee[-1]),
             "revenue24h": round(rev[-1]),
-            "volumeAllTime": round(sum(vol)),
+            "volumeAllTime": round(vol.sum()),
         }
 
-    total_opt_vol_24h = sum(p["volume24h"] for p in options_proto_info.values())
-    options_market_share = {}
-    for slug, p in options_proto_info.items():
-        if p["volume24h"] > 0:
-            options_market_share[p["displayName"]] = round((p["volume24h"] / total_opt_vol_24h) * 100, 2)
+    opt_vol_24h = np.rint(options_vol[:, -1])
+    total_opt_vol_24h = int(opt_vol_24h.sum())
+    options_market_share = {
+        name: round((v / total_opt_vol_24h) * 100, 2)
+        for name, v in zip(options_names, opt_vol_24h.tolist()) if v > 0
+    }
 
     options_metrics = {
         "volume24h": total_opt_vol_24h,
-        "fees24h": sum(p["fees24h"] for p in options_proto_info.values()),
-        "revenue24h": sum(p["revenue24h"] for p in options_proto_info.values()),
+        "fees24h": int(np.rint(options_fee[:, -1]).sum()),
+        "revenue24h": int(np.rint(options_rev[:, -1]).sum()),
         "tvl": 0,
     }
 
@@ -371,29 +419,40 @@ def main():
     ]
 
     # Prediction market history (daily snapshots for the last 90 days)
-    pred_history = []
     pred_dates = date_range(end_date - timedelta(days=89), end_date)
-    for i, d in enumerate(pred_dates):
-        t = i / len(pred_dates)
-        poly_snap_total = poly_total_vol * (0.85 + 0.15 * t) * (1 + random.gauss(0, 0.02))
-        poly_snap_crypto = poly_crypto_vol * (0.8 + 0.2 * t) * (1 + random.gauss(0, 0.03))
-        kalshi_snap_total = kalshi_total * (0.9 + 0.1 * t) * (1 + random.gauss(0, 0.02))
-        kalshi_snap_crypto = kalshi_crypto * (0.85 + 0.15 * t) * (1 + random.gauss(0, 0.03))
-
-        pred_history.append({
+    t = np.arange(len(pred_dates)) / len(pred_dates)
+    noise = _rng.standard_normal((4, len(pred_dates))) * np.array([0.02, 0.03, 0.02, 0.03])[:, None]
+    poly_snap_total = poly_total_vol * (0.85 + 0.15 * t) * (1 + noise[0])
+    poly_snap_crypto = poly_crypto_vol * (0.8 + 0.2 * t) * (1 + noise[1])
+    kalshi_snap_total = kalshi_total * (0.9 + 0.1 * t) * (1 + noise[2])
+    kalshi_snap_crypto = kalshi_crypto * (0.85 + 0.15 * t) * (1 + noise[3])
+
+    pred_history = [
+        {
             "date": d,
             "polymarket": {
-                "totalVolume": round(poly_snap_total),
-                "cryptoVolume": round(poly_snap_crypto),
-                "pricePredictionPct": round(poly_snap_crypto / poly_snap_total * 100, 2),
-                "totalLiquidity": round(350e6 * (0.9 + 0.1 * t)),
+                "totalVolume": p_total,
+                "cryptoVolume": p_crypto,
+                "pricePredictionPct": round(p_pct, 2),
+                "totalLiquidity": p_liquidity,
             },
             "kalshi": {
-                "totalContracts": round(kalshi_snap_total),
-                "cryptoContracts": round(kalshi_snap_crypto),
-                "pricePredictionPct": round(kalshi_price_pct * (0.95 + 0.05 * t), 2),
+                "totalContracts": k_total,
+                "cryptoContracts": k_crypto,
+                "pricePredictionPct": round(k_pct, 2),
             },
-        })
+        }
+        for d, p_total, p_crypto, p_pct, p_liquidity, k_total, k_crypto, k_pct in zip(
+            pred_dates,
+            rounded(poly_snap_total),
+            rounded(poly_snap_crypto),
+            (poly_snap_crypto / poly_snap_total * 100).tolist(),
+            rounded(350e6 * (0.9 + 0.1 * t)),
+            rounded(kalshi_snap_total),
+            rounded(kalshi_snap_crypto),
+            (kalshi_price_pct * (0.95 + 0.05 * t)).tolist(),
+        )
+    ]
 
     # ═══════════════════════════════════════════════════════════════
     # ASSEMBLE DASHBOARD DATA
@@ -454,27 +513,37 @@ def main():
             },
         },
         "predictionMarketShare": pred_market_share,
-        "predictionHistory": pred_history,
     }
 
     # Write data.js
     os.makedirs(DASHBOARD_DIR, exist_ok=True)
-    js_content = (
+    header = (
         "// Auto-generated by generate_sample_data.py — sample data for demonstration\n"
         f"// Generated: {dashboard_data['lastUpdated']}\n"
         "// Run `python update_data.py` with internet access to fetch live data\n"
-        f"const DASHBOARD_DATA = {json.dumps(dashboard_data)};\n"
     )
     output_path = os.path.join(DASHBOARD_DIR, "data.js")
-    with open(output_path, "w") as f:
-        f.write(js_content)
+    with open(output_path, "wb") as f:
+        f.write(header.encode())
+        f.write(b"const DASHBOARD_DATA = ")
+        f.write(orjson.dumps(dashboard_data, option=orjson.OPT_SERIALIZE_NUMPY))
+        f.write(b";\n")
     print(f"Sample data written to {output_path}")
     print(f"File size: {os.path.getsize(output_path) / 1024:.1f} KB")
 
+    # Prediction history is loaded separately from history.js
+    history_path = os.path.join(DASHBOARD_DIR, "history.js")
+    with open(history_path, "wb") as f:
+        f.write(header.encode())
+        f.write(b"const PREDICTION_HISTORY = ")
+        f.write(orjson.dumps(pred_history))
+        f.write(b";\n")
+    print(f"Prediction history written to {history_path}")
+
     # Also save history.json
     os.makedirs(DATA_DIR, exist_ok=True)
-    with open(os.path.join(DATA_DIR, "history.json"), "w") as f:
-        json.dump({"snapshots": [], "predictionHistory": pred_history}, f)
+    with open(os.path.join(DATA_DIR, "history.json"), "wb") as f:
+        f.write(orjson.dumps({"snapshots": [], "predictionHistory": pred_history}))
     print("History saved to data/history.json")
 
 
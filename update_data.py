@@ -8,186 +8,224 @@ Usage:
 Run once daily to fetch fresh data from all sources and regenerate the dashboard.
 """
 
-import json
 import os
-import sys
 import time
-from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 
-from collectors.defillama import fetch_all_perps_data, fetch_all_options_data
-from collectors.polymarket import fetch_all_polymarket_data
-from collectors.kalshi import fetch_all_kalshi_data
+import numpy as np
+import orjson
+
+from collectors import run
+from collectors.runner import fetch_all
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
 DASHBOARD_DIR = os.path.join(os.path.dirname(__file__), "dashboard")
 HISTORY_FILE = os.path.join(DATA_DIR, "history.json")
+HISTORY_DAYS = 400  # days of prediction market snapshots kept in history
+DAILY_HISTORY_DAYS = 90  # older snapshots are folded into weekly means
+
+# orjson options for the human-readable history.json: two-space indents, and
+# non-string dict keys coerced to strings as the json module did
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
 
 def load_history():
-    """Load existing historical snapshots."""
-    if os.path.exists(HISTORY_FILE):
-        with open(HISTORY_FILE, "r") as f:
-            return json.load(f)
+    """
+    Load existing historical snapshots.
+
+    An unreadable file (e.g. truncated by an interrupted run) is moved aside
+    to history.json.corrupt rather than overwritten, and history restarts.
+    """
+    try:
+        with open(HISTORY_FILE, "rb") as f:
+            return orjson.loads(f.read())
+    except FileNotFoundError:
+        pass
+    except ValueError as e:
+        print(f"  Could not parse {HISTORY_FILE} ({e}); moving it aside")
+        os.replace(HISTORY_FILE, HISTORY_FILE + ".corrupt")
     return {"snapshots": [], "predictionHistory": []}
 
 
-def save_history(history):
-    """Save historical snapshots."""
-    os.makedirs(DATA_DIR, exist_ok=True)
-    with open(HISTORY_FILE, "w") as f:
-        json.dump(history, f, indent=2)
+def load_latest(name):
+    """Load the last saved raw snapshot for a source, or None if there isn't one."""
+    path = os.path.join(DATA_DIR, f"{name}_latest.json")
+    try:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    print(f"  Using last saved {name} data from {path}")
+    return data
 
 
-def _aggregate_volume_timeseries(protocols_data, top_n=6):
-    """
-    Build a unified timeseries from per-protocol volume history dicts.
-    Returns { dates: [...], series: { "Proto": [...], ... } }
-    Groups smaller protocols into "Others".
+def _write_json(path, obj, option=JSON_OPTIONS):
     """
-    # Collect all dates
-    all_dates = set()
-    proto_volumes = {}
-    for slug, pdata in protocols_data.items():
-        hist = pdata.get("volumeHistory", {})
-        if hist:
-            all_dates.update(hist.keys())
-            proto_volumes[pdata.get("displayName", slug)] = hist
-
-    if not all_dates:
-        return {"dates": [], "series": {}}
-
-    dates = sorted(all_dates)
+    Write `obj` to `path` as JSON, indented unless other orjson `option`s
+    are given.
 
-    # Rank protocols by total volume
-    ranked = sorted(
-        proto_volumes.items(),
-        key=lambda x: sum(x[1].values()),
-        reverse=True,
-    )
-
-    top_protos = [name for name, _ in ranked[:top_n]]
-    others = [name for name, _ in ranked[top_n:]]
+    The file is left untouched if it already holds exactly these bytes (as
+    when every fetch failed and fell back to the same data), which avoids
+    the disk write and a no-op change in git. Sizes are compared first, so
+    the old file is only read back when it could be identical.
+    """
+    payload = orjson.dumps(obj, option=option)
+    try:
+        if os.path.getsize(path) == len(payload):
+            with open(path, "rb") as f:
+                if f.read() == payload:
+                    return
+    except OSError:
+        pass
+    _replace_file(path, payload)
+
+
+def _replace_file(path, *chunks):
+    """
+    Write the byte `chunks` to a temp file beside `path` and rename it into
+    place, so an interrupted run leaves the previous file intact rather than
+    truncated. Chunks are written one after another rather than joined, so
+    no second copy of a large payload is built.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.writelines(chunks)
+    os.replace(tmp, path)
 
-    series = {}
-    for name in top_protos:
-        series[name] = [proto_volumes[name].get(d, 0) for d in dates]
 
-    if others:
-        others_series = []
-        for d in dates:
-            others_series.append(sum(proto_volumes[name].get(d, 0) for name in others))
-        series["Others"] = others_series
+def save_history(history):
+    """Save historical snapshots."""
+    os.makedirs(DATA_DIR, exist_ok=True)
+    _write_json(HISTORY_FILE, history)
 
-    return {"dates": dates, "series": series}
 
+def _aggregate_timeseries(protocols_data, field, rank, top_n=6):
+    """
+    Align per-protocol {date: value} histories on one shared date axis.
 
-def _aggregate_fees_timeseries(protocols_data, field="feesHistory", top_n=6):
-    """Build unified timeseries from per-protocol fees/revenue history."""
-    all_dates = set()
-    proto_fees = {}
+    Protocols are ranked by `rank` (np.sum or np.max) over their history;
+    the top_n keep their own series and the rest are summed into "Others".
+    Histories are packed into one protocols x dates array so ranking and the
+    Others series are single NumPy reductions.
+    Returns { dates: [...], series: { "Proto": [...], ... } }
+    """
+    histories = {}
     for slug, pdata in protocols_data.items():
         hist = pdata.get(field, {})
         if hist:
-            all_dates.update(hist.keys())
-            proto_fees[pdata.get("displayName", slug)] = hist
+            histories[pdata.get("displayName", slug)] = hist
 
-    if not all_dates:
+    if not histories:
         return {"dates": [], "series": {}}
 
-    dates = sorted(all_dates)
-    ranked = sorted(
-        proto_fees.items(),
-        key=lambda x: sum(x[1].values()),
-        reverse=True,
-    )
-
-    top_protos = [name for name, _ in ranked[:top_n]]
-    others_names = [name for name, _ in ranked[top_n:]]
-
+    dates = sorted(set().union(*histories.values()))
+    column = {d: i for i, d in enumerate(dates)}
+    names = list(histories)
+    values = np.zeros((len(names), len(dates)))
+    for row, hist in zip(values, histories.values()):
+        cols = np.fromiter(map(column.__getitem__, hist), np.intp, len(hist))
+        try:
+            row[cols] = np.fromiter(hist.values(), np.float64, len(hist))
+        except (TypeError, ValueError):
+            row[cols] = [v or 0 for v in hist.values()]
+    # Missing (None) points come through as NaN and count as zero; JSON
+    # histories can't hold a real NaN
+    values[np.isnan(values)] = 0
+
+    # Stable, so protocols that tie keep their input order
+    order = np.argsort(-rank(values, axis=1), kind="stable")
+    top, others = order[:top_n], order[top_n:]
+
+    # Top series keep their raw values; each is filled from its own points
+    # rather than looking up every date on the axis
     series = {}
-    for name in top_protos:
-        series[name] = [proto_fees[name].get(d, 0) for d in dates]
+    for i in top:
+        row = [0] * len(dates)
+        for d, v in histories[names[i]].items():
+            row[column[d]] = v
+        series[names[i]] = row
 
-    if others_names:
-        series["Others"] = [
-            sum(proto_fees[name].get(d, 0) for name in others_names)
-            for d in dates
-        ]
+    if len(others):
+        series["Others"] = values[others].sum(axis=0).tolist()
 
     return {"dates": dates, "series": series}
 
 
-def _aggregate_tvl_timeseries(protocols_data, top_n=6):
-    """Build unified TVL timeseries."""
-    all_dates = set()
-    proto_tvl = {}
-    for slug, pdata in protocols_data.items():
-        hist = pdata.get("tvlHistory", {})
-        if hist:
-            all_dates.update(hist.keys())
-            proto_tvl[pdata.get("displayName", slug)] = hist
+def _aggregate_volume_timeseries(protocols_data, top_n=6):
+    """
+    Build a unified timeseries from per-protocol volume history dicts.
+    Returns { dates: [...], series: { "Proto": [...], ... } }
+    Groups smaller protocols into "Others".
+    """
+    return _aggregate_timeseries(protocols_data, "volumeHistory", np.sum, top_n)
 
-    if not all_dates:
-        return {"dates": [], "series": {}}
 
-    dates = sorted(all_dates)
-    ranked = sorted(
-        proto_tvl.items(),
-        key=lambda x: max(x[1].values()) if x[1] else 0,
-        reverse=True,
-    )
-
-    top_protos = [name for name, _ in ranked[:top_n]]
-    others_names = [name for name, _ in ranked[top_n:]]
+def _aggregate_fees_timeseries(protocols_data, field="feesHistory", top_n=6):
+    """Build unified timeseries from per-protocol fees/revenue history."""
+    return _aggregate_timeseries(protocols_data, field, np.sum, top_n)
 
-    series = {}
-    for name in top_protos:
-        series[name] = [proto_tvl[name].get(d, 0) for d in dates]
 
-    if others_names:
-        series["Others"] = [
-            sum(proto_tvl[name].get(d, 0) for name in others_names)
-            for d in dates
-        ]
+def _aggregate_tvl_timeseries(protocols_data, top_n=6):
+    """Build unified TVL timeseries, ranking protocols by peak TVL."""
+    return _aggregate_timeseries(protocols_data, "tvlHistory", np.max, top_n)
 
-    return {"dates": dates, "series": series}
 
+# Per-protocol fields copied into the dashboard, with their defaults
+PERPS_FIELDS = (
+    ("volume24h", 0), ("volume7d", 0), ("volume30d", 0),
+    ("fees24h", 0), ("revenue24h", 0), ("currentTvl", 0),
+    ("volumeChange1d", None), ("volumeChange7d", None), ("volumeChange1m", None),
+)
+OPTIONS_FIELDS = (
+    ("volume24h", 0), ("notionalVolume24h", 0), ("premiumVolume24h", 0),
+    ("fees24h", 0), ("revenue24h", 0), ("volumeAllTime", 0),
+)
 
-def _market_share(protocols_data, metric="volume24h"):
-    """Calculate current market share by a given metric."""
-    shares = {}
-    for slug, pdata in protocols_data.items():
-        name = pdata.get("displayName", slug)
-        val = pdata.get(metric, 0) or 0
-        if val > 0:
-            shares[name] = val
 
+def _market_share(shares):
+    """Convert { name: value } into percentage shares, largest first."""
     total = sum(shares.values())
     if total == 0:
         return {}
 
-    return {name: round((val / total) * 100, 2) for name, val in
-            sorted(shares.items(), key=lambda x: x[1], reverse=True)}
-
-
-def _current_metrics(protocols_data):
-    """Extract current snapshot metrics for summary cards."""
-    total_vol_24h = sum((p.get("volume24h", 0) or 0) for p in protocols_data.values())
-    total_fees_24h = sum((p.get("fees24h", 0) or 0) for p in protocols_data.values())
-    total_revenue_24h = sum((p.get("revenue24h", 0) or 0) for p in protocols_data.values())
-    total_tvl = sum((p.get("currentTvl", 0) or 0) for p in protocols_data.values())
-
-    return {
-        "volume24h": total_vol_24h,
-        "fees24h": total_fees_24h,
-        "revenue24h": total_revenue_24h,
-        "tvl": total_tvl,
-    }
+    ranked = sorted(shares.items(), key=itemgetter(1), reverse=True)
+    return {name: round((val / total) * 100, 2) for name, val in ranked}
 
 
-def build_dashboard_data(perps_data, options_data, polymarket_data, kalshi_data):
-    """Process raw data into the format needed by the dashboard."""
-    now = datetime.now(timezone.utc).isoformat()
+def _summarize_protocols(protocols_data, fields):
+    """
+    Build the dashboard's per-protocol rows, summary-card metrics and
+    volume market share in a single pass over the protocols.
+    Returns (protocols, metrics, market_share).
+    """
+    protocols = {}
+    metrics = {"volume24h": 0, "fees24h": 0, "revenue24h": 0, "tvl": 0}
+    shares = {}
+    for slug, p in protocols_data.items():
+        name = p.get("displayName", slug)
+        row = {"displayName": name}
+        for field, default in fields:
+            row[field] = p.get(field, default)
+        protocols[slug] = row
+
+        vol = p.get("volume24h", 0) or 0
+        metrics["volume24h"] += vol
+        metrics["fees24h"] += p.get("fees24h", 0) or 0
+        metrics["revenue24h"] += p.get("revenue24h", 0) or 0
+        metrics["tvl"] += p.get("currentTvl", 0) or 0
+        if vol > 0:
+            shares[name] = vol
+    return protocols, metrics, _market_share(shares)
+
+
+def build_dashboard_data(perps_data, options_data, polymarket_data, kalshi_data, now=None):
+    """
+    Process raw data into the format needed by the dashboard.
+    `now` is the run's UTC timestamp (defaults to the current time).
+    """
+    now = now or datetime.now(timezone.utc)
 
     # --- Perps ---
     perps_protocols = perps_data or {}
@@ -195,16 +233,14 @@ def build_dashboard_data(perps_data, options_data, polymarket_data, kalshi_data)
     perps_fees_ts = _aggregate_fees_timeseries(perps_protocols, "feesHistory")
     perps_revenue_ts = _aggregate_fees_timeseries(perps_protocols, "revenueHistory")
     perps_tvl_ts = _aggregate_tvl_timeseries(perps_protocols)
-    perps_share = _market_share(perps_protocols, "volume24h")
-    perps_metrics = _current_metrics(perps_protocols)
+    perps_rows, perps_metrics, perps_share = _summarize_protocols(perps_protocols, PERPS_FIELDS)
 
     # --- Options ---
     options_protocols = options_data.get("protocols", {}) if options_data else {}
     options_volume_ts = _aggregate_volume_timeseries(options_protocols)
     options_fees_ts = _aggregate_fees_timeseries(options_protocols, "feesHistory")
     options_revenue_ts = _aggregate_fees_timeseries(options_protocols, "revenueHistory")
-    options_share = _market_share(options_protocols, "volume24h")
-    options_metrics = _current_metrics(options_protocols)
+    options_rows, options_metrics, options_share = _summarize_protocols(options_protocols, OPTIONS_FIELDS)
 
     # Use overview total history if available
     options_total_history = {}
@@ -255,7 +291,7 @@ def build_dashboard_data(perps_data, options_data, polymarket_data, kalshi_data)
 
     # --- Assemble final data ---
     dashboard_data = {
-        "lastUpdated": now,
+        "lastUpdated": now.isoformat(),
         "perps": {
             "metrics": perps_metrics,
             "volumeTimeseries": perps_volume_ts,
@@ -263,21 +299,7 @@ def build_dashboard_data(perps_data, options_data, polymarket_data, kalshi_data)
             "revenueTimeseries": perps_revenue_ts,
             "tvlTimeseries": perps_tvl_ts,
             "marketShare": perps_share,
-            "protocols": {
-                slug: {
-                    "displayName": p.get("displayName", slug),
-                    "volume24h": p.get("volume24h", 0),
-                    "volume7d": p.get("volume7d", 0),
-                    "volume30d": p.get("volume30d", 0),
-                    "fees24h": p.get("fees24h", 0),
-                    "revenue24h": p.get("revenue24h", 0),
-                    "currentTvl": p.get("currentTvl", 0),
-                    "volumeChange1d": p.get("volumeChange1d"),
-                    "volumeChange7d": p.get("volumeChange7d"),
-                    "volumeChange1m": p.get("volumeChange1m"),
-                }
-                for slug, p in perps_protocols.items()
-            },
+            "protocols": perps_rows,
         },
         "options": {
             "metrics": options_metrics,
@@ -286,18 +308,7 @@ def build_dashboard_data(perps_data, options_data, polymarket_data, kalshi_data)
             "revenueTimeseries": options_revenue_ts,
             "totalVolumeHistory": options_total_history,
             "marketShare": options_share,
-            "protocols": {
-                slug: {
-                    "displayName": p.get("displayName", slug),
-                    "volume24h": p.get("volume24h", 0),
-                    "notionalVolume24h": p.get("notionalVolume24h", 0),
-                    "premiumVolume24h": p.get("premiumVolume24h", 0),
-                    "fees24h": p.get("fees24h", 0),
-                    "revenue24h": p.get("revenue24h", 0),
-                    "volumeAllTime": p.get("volumeAllTime", 0),
-                }
-                for slug, p in options_protocols.items()
-            },
+            "protocols": options_rows,
         },
         "predictions": predictions,
         "predictionMarketShare": pred_share,
@@ -306,92 +317,195 @@ def build_dashboard_data(perps_data, options_data, polymarket_data, kalshi_data)
     return dashboard_data
 
 
-def save_prediction_snapshot(history, polymarket_data, kalshi_data):
-    """Append a daily snapshot for prediction market historical tracking."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    snapshots = history.get("predictionHistory", [])
-
-    # Don't duplicate today's entry
+def save_prediction_snapshot(history, polymarket_data, kalshi_data, now=None):
+    """
+    Append a daily snapshot for prediction market historical tracking.
+    `now` is the run's UTC timestamp (defaults to the current time).
+    """
+    now = now or datetime.now(timezone.utc)
+    today = now.strftime("%Y-%m-%d")
+    snapshots = history.setdefault("predictionHistory", [])
+
+    # A failed collector returns None. Its data must never replace good
+    # values, so with nothing fetched the history is left as it is
+    if polymarket_data is None and kalshi_data is None:
+        print("  No prediction market data fetched; history left unchanged")
+        return history
+
+    # Don't duplicate today's entry. A source that failed this run keeps
+    # the values from today's earlier run; without one it is left out, so
+    # no day records values that weren't observed on it.
+    previous = {}
     if snapshots and snapshots[-1].get("date") == today:
-        snapshots.pop()
-
-    poly = polymarket_data or {}
-    kalshi_d = kalshi_data or {}
+        previous = snapshots.pop()
 
-    snapshots.append({
-        "date": today,
-        "polymarket": {
+    snapshot = {"date": today}
+    if polymarket_data is not None:
+        poly = polymarket_data
+        snapshot["polymarket"] = {
             "totalVolume": poly.get("totalVolume", {}).get("total", 0),
             "cryptoVolume": poly.get("cryptoVolume", {}).get("total", 0),
             "pricePredictionPct": poly.get("pricePredictionPct", 0),
             "totalLiquidity": poly.get("totalLiquidity", 0),
-        },
-        "kalshi": {
+        }
+    elif "polymarket" in previous:
+        snapshot["polymarket"] = previous["polymarket"]
+    if kalshi_data is not None:
+        kalshi_d = kalshi_data
+        snapshot["kalshi"] = {
             "totalContracts": kalshi_d.get("totalStats", {}).get("totalContracts", 0),
             "cryptoContracts": kalshi_d.get("cryptoStats", {}).get("totalContracts", 0),
             "pricePredictionPct": kalshi_d.get("pricePredictionPct", 0),
-        },
-    })
-
-    history["predictionHistory"] = snapshots
+        }
+    elif "kalshi" in previous:
+        snapshot["kalshi"] = previous["kalshi"]
+    snapshots.append(snapshot)
+
+    # Keep a rolling window so the history file (and data.js) stay bounded.
+    # Snapshots are appended in date order, so the stale ones are a prefix
+    # that can be dropped from the list in place.
+    cutoff = (now - timedelta(days=HISTORY_DAYS)).strftime("%Y-%m-%d")
+    stale = 0
+    while stale < len(snapshots) and snapshots[stale].get("date", "") < cutoff:
+        stale += 1
+    del snapshots[:stale]
+
+    # Past the daily window, keep one averaged snapshot per week
+    weekly_cutoff = (now - timedelta(days=DAILY_HISTORY_DAYS)).strftime("%Y-%m-%d")
+    snapshots[:] = _compact_weekly(snapshots, weekly_cutoff)
     return history
 
 
-def generate_dashboard_js(dashboard_data, prediction_history):
-    """Write the dashboard data as a JavaScript file for the frontend."""
-    # Include prediction history in the data
-    dashboard_data["predictionHistory"] = prediction_history
+def _week_start(date):
+    """Monday of the week containing a YYYY-MM-DD date, in the same format."""
+    day = datetime.strptime(date, "%Y-%m-%d")
+    return (day - timedelta(days=day.weekday())).strftime("%Y-%m-%d")
+
+
+def _weekly_mean(snaps):
+    """
+    Average a week of daily snapshots into one, dated by the week's first
+    snapshot and tagged with tier "weekly". Each stat is averaged over the days that
+    have it; source blocks that are missing or all zero (a failed fetch)
+    are left out. Integer stats stay integers.
+    """
+    row = {"date": snaps[0]["date"], "tier": "weekly"}
+    for snap in snaps:
+        for source, stats in snap.items():
+            if isinstance(stats, dict) and any(stats.values()):
+                values = row.setdefault(source, {})
+                for key, val in stats.items():
+                    if val is not None:
+                        values.setdefault(key, []).append(val)
+    for source, stats in row.items():
+        if isinstance(stats, dict):
+            for key, vals in stats.items():
+                mean = sum(vals) / len(vals)
+                ints = all(isinstance(v, int) for v in vals)
+                stats[key] = round(mean) if ints else round(mean, 2)
+    return row
+
+
+def _compact_weekly(snapshots, cutoff):
+    """
+    Fold the daily snapshots of each whole week ending before `cutoff` into
+    one weekly mean, keeping date order. Only complete weeks are folded, so
+    a week is compacted once and its row is never revisited. The row takes
+    its first day's date, so the rolling window drops it no earlier than
+    that day would have been dropped. Snapshots without a date are kept
+    as they are.
+    """
+    cutoff_week = _week_start(cutoff)
+    weeks = {}
+    compacted = []
+    for snap in snapshots:
+        date = snap.get("date", "")
+        if snap.get("tier") or not date or date >= cutoff_week:
+            compacted.append(snap)
+            continue
+        week = _week_start(date)
+        if week not in weeks:
+            weeks[week] = []
+            compacted.append(week)
+        weeks[week].append(snap)
+    return [_weekly_mean(weeks[item]) if isinstance(item, str) else item for item in compacted]
 
-    js_content = (
+
+def generate_dashboard_js(dashboard_data, prediction_history):
+    """
+    Write the dashboard data as JavaScript files for the frontend: the
+    current snapshot to data.js and the prediction history to history.js.
+    """
+    header = (
         "// Auto-generated by update_data.py — do not edit manually\n"
         f"// Last updated: {dashboard_data['lastUpdated']}\n"
-        f"const DASHBOARD_DATA = {json.dumps(dashboard_data, indent=2)};\n"
     )
 
     os.makedirs(DASHBOARD_DIR, exist_ok=True)
     output_path = os.path.join(DASHBOARD_DIR, "data.js")
-    with open(output_path, "w") as f:
-        f.write(js_content)
+    # Compact: the browser ignores whitespace, and indenting a payload
+    # this size is the slowest serialization mode and ~40% more bytes
+    payload = orjson.dumps(dashboard_data, option=orjson.OPT_NON_STR_KEYS)
+    _replace_file(output_path, header.encode(), b"const DASHBOARD_DATA = ", payload, b";\n")
     print(f"\nDashboard data written to {output_path}")
 
+    history_path = os.path.join(DASHBOARD_DIR, "history.js")
+    payload = orjson.dumps(prediction_history)
+    _replace_file(history_path, header.encode(), b"const PREDICTION_HISTORY = ", payload, b";\n")
+    print(f"Prediction history written to {history_path}")
+
 
 def main():
     start = time.time()
+    # One timestamp for the whole run, so the snapshot date and the
+    # dashboard's lastUpdated agree even if the run crosses midnight
+    now = datetime.now(timezone.utc)
     print(f"{'='*60}")
     print(f"Crypto Derivatives Market Intelligence - Data Update")
-    print(f"Started: {datetime.now(timezone.utc).isoformat()}")
+    print(f"Started: {now.isoformat()}")
     print(f"{'='*60}")
 
     # Load existing history
     history = load_history()
 
-    # Fetch all data
-    perps_data = fetch_all_perps_data()
-    options_data = fetch_all_options_data()
-    polymarket_data = fetch_all_polymarket_data()
-    kalshi_data = fetch_all_kalshi_data()
+    # Fetch all data (collectors run concurrently)
+    sources = run(fetch_all())
+    polymarket_data = sources["polymarket"]
+    kalshi_data = sources["kalshi"]
 
-    # Save raw data snapshots
+    # The dashboard shows a failed source's last saved data rather than zeros
+    dashboard_sources = {
+        name: data if data is not None else load_latest(name)
+        for name, data in sources.items()
+    }
+
+    # Save raw data snapshots ({source}_latest.json) on worker threads,
+    # overlapping with the history and dashboard work below. They're only
+    # read by machines, so they're written compact.
     os.makedirs(DATA_DIR, exist_ok=True)
-    with open(os.path.join(DATA_DIR, "perps_latest.json"), "w") as f:
-        json.dump(perps_data, f, indent=2)
-    with open(os.path.join(DATA_DIR, "options_latest.json"), "w") as f:
-        json.dump(options_data, f, indent=2)
-    with open(os.path.join(DATA_DIR, "polymarket_latest.json"), "w") as f:
-        json.dump(polymarket_data, f, indent=2)
-    with open(os.path.join(DATA_DIR, "kalshi_latest.json"), "w") as f:
-        json.dump(kalshi_data, f, indent=2)
-    print("\nRaw data saved to data/ directory")
+    with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+        raw_writes = [
+            pool.submit(_write_json, os.path.join(DATA_DIR, f"{name}_latest.json"), data,
+                        orjson.OPT_NON_STR_KEYS)
+            for name, data in sources.items()
+            if data is not None  # a failed source keeps its last good snapshot
+        ]
 
-    # Save prediction history
-    history = save_prediction_snapshot(history, polymarket_data, kalshi_data)
-    save_history(history)
+        # Save prediction history
+        history = save_prediction_snapshot(history, polymarket_data, kalshi_data, now)
+        save_history(history)
 
-    # Build dashboard data
-    dashboard_data = build_dashboard_data(perps_data, options_data, polymarket_data, kalshi_data)
+        # Build dashboard data
+        dashboard_data = build_dashboard_data(
+            dashboard_sources["perps"], dashboard_sources["options"],
+            dashboard_sources["polymarket"], dashboard_sources["kalshi"], now)
 
-    # Generate JS data file
-    generate_dashboard_js(dashboard_data, history.get("predictionHistory", []))
+        # Generate JS data file
+        generate_dashboard_js(dashboard_data, history.get("predictionHistory", []))
+
+    for write in raw_writes:
+        write.result()  # re-raise any write error
+    print("\nRaw data saved to data/ directory")
 
     elapsed = time.time() - start
     print(f"\n{'='*60}")